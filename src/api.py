@@ -100,7 +100,7 @@ def create_app(coordinator: RelayCoordinator, settings: Settings) -> FastAPI:
     async def get_features(request: Request, user: dict = Depends(get_current_user)):
         """Get all feature flags."""
         flags = await coordinator.config_store.get_feature_flags()
-        return {"features": flags}
+        return {"features": dict(flags)}
 
     @app.post("/api/features/{feature_name}")
     @limiter.limit("10/minute")
@@ -248,7 +248,7 @@ def create_app(coordinator: RelayCoordinator, settings: Settings) -> FastAPI:
     async def get_rss_feeds(request: Request, user: dict = Depends(get_current_user)):
         """Get all RSS feeds."""
         feeds = await coordinator.config_store.list_rss_feeds()
-        return {"feeds": feeds}
+        return {"feeds": list(feeds)}
 
     @app.post("/api/rss")
     @limiter.limit("10/minute")
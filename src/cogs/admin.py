@@ -80,7 +80,8 @@ class AdminCog(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def relay_restart(self, interaction: discord.Interaction) -> None:
         await interaction.response.send_message(
-            "♻️ Restarting relay… the bot will disconnect briefly while it comes back online.",
+            "♻️ Restarting relay… the bot exits and comes back online only if a supervisor "
+            "(systemd, Docker) restarts it.",
             ephemeral=True,
         )
         await self.coordinator.request_restart()
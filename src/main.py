@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import socket
+import sys
 from contextlib import suppress
 from pathlib import Path
 
@@ -12,7 +13,7 @@ import uvicorn
 
 from .api import create_app
 from .config import settings, validate_settings
-from .relay import RelayCoordinator
+from .relay import RESTART_EXIT_CODE, RelayCoordinator
 
 logger = logging.getLogger(__name__)
 
@@ -120,7 +121,7 @@ async def run_api(coordinator: RelayCoordinator) -> None:
         return
 
 
-async def main_async() -> None:
+async def main_async() -> int:
     configure_logging()
     
     # Set asyncio exception handler to suppress known harmless errors
@@ -214,12 +215,18 @@ async def main_async() -> None:
         # Give a small delay to allow any remaining cleanup
         await asyncio.sleep(0.1)
 
+    return RESTART_EXIT_CODE if coordinator.restart_requested else 0
+
 
 def main() -> None:
     try:
-        asyncio.run(main_async())
+        exit_code = asyncio.run(main_async())
     except KeyboardInterrupt:
         logging.info("Interrupted, shutting down cleanly.")
+        return
+    if exit_code:
+        logging.info("Exiting with code %s so the supervisor restarts the relay.", exit_code)
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
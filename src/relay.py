@@ -1,16 +1,14 @@
 import asyncio
+import functools
 import logging
-import os
-import sys
+import random
 import time
-from typing import Optional, Union
+from typing import Any, Optional
 
+import aiohttp
 import discord
-import httpx
 import pydle
 from discord.ext import commands
-from telegram import Update
-from telegram.ext import AIORateLimiter, Application, ContextTypes, MessageHandler, filters
 
 from .config import Settings
 from .cogs import (
@@ -35,6 +33,76 @@ from .storage import ConfigStore
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of messages buffered in each relay direction before dropping.
+RELAY_QUEUE_MAXSIZE = 500
+
+# Consecutive IRC lines from one author arriving within this window are sent as one message.
+IRC_COALESCE_WINDOW_SECONDS = 0.25
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Delay between consecutive sends on one IRC network (basic flood protection).
+IRC_SEND_INTERVAL_SECONDS = 0.5
+
+# How long callers wait for on_discord_ready to resolve the relay channel before fetching it themselves.
+CHANNEL_READY_TIMEOUT_SECONDS = 10.0
+
+# How long a get_health_stats() snapshot is reused.
+HEALTH_STATS_TTL_SECONDS = 1.0
+
+# Maximum concurrent Discord webhook requests.
+WEBHOOK_MAX_CONCURRENCY = 5
+# Total time allowed per webhook request, so a hung POST can't hold a concurrency slot.
+WEBHOOK_TIMEOUT_SECONDS = 10.0
+
+# Process exit code signalling that /relayrestart asked the supervisor to relaunch us.
+RESTART_EXIT_CODE = 42
+
+
+@functools.lru_cache(maxsize=512)
+def _format_uptime_cached(total_minutes: int) -> str:
+    """Format whole minutes of uptime; keyed per minute since that is the finest unit shown."""
+    days, minutes = divmod(total_minutes, 1440)
+    hours, minutes = divmod(minutes, 60)
+    parts = [f"{value}{unit}" for value, unit in ((days, "d"), (hours, "h"), (minutes, "m")) if value]
+    return " ".join(parts) if parts else "0s"
+
+
+# Shared, never mutated: relayed text must not ping anyone.
+_NO_MENTIONS = discord.AllowedMentions.none()
+
+# Capped exponential backoff for IRC reconnects.
+IRC_RECONNECT_BASE_SECONDS = 5
+IRC_RECONNECT_MAX_SECONDS = 300
+
+
+def _reconnect_delay(attempt: int) -> float:
+    """Return the backoff before reconnect attempt ``attempt``, with jitter to spread retries."""
+    return min(IRC_RECONNECT_MAX_SECONDS, IRC_RECONNECT_BASE_SECONDS * 2 ** min(attempt, 10)) + random.random()
+
+
+# pydle raises this when two readers race on one connection (seen with several networks);
+# recreating the client after a short pause is enough to recover.
+_READ_CONFLICT_MARKER = "readuntil() called while another coroutine is already waiting"
+_READ_CONFLICT_RETRY_SECONDS = 2
+
+
+def _is_read_conflict(exc: Exception) -> bool:
+    if isinstance(exc, OSError):
+        return False
+    message = exc.args[0] if exc.args and isinstance(exc.args[0], str) else str(exc)
+    return _READ_CONFLICT_MARKER in message
+
+
+# pydle raises these when a server sends a line with an unexpected parameter count.
+_UNPACK_ERROR_FRAGMENTS = ("too many values to unpack", "not enough values to unpack")
+
+
+def _error_message_contains(exc: Exception, fragments: tuple[str, ...]) -> bool:
+    """Case-insensitively check an exception's message for any of the (lowercase) fragments."""
+    message = exc.args[0] if exc.args and isinstance(exc.args[0], str) else str(exc)
+    message = message.lower()
+    return any(fragment in message for fragment in fragments)
+
 
 class IRCRelayClient(pydle.Client):
     """IRC client that forwards events back to the relay coordinator."""
@@ -51,7 +119,15 @@ class IRCRelayClient(pydle.Client):
         self.coordinator = coordinator
         self.network_config = network_config
         self.target_channel = network_config.channel
+        # Precomputed per-client values used on every received message.
+        self._target_channel_key = network_config.channel.casefold()
+        # Only tag relayed usernames with the network when several are bridged.
+        multiple_networks = len(coordinator.settings.irc_networks) > 1
+        self._network_suffix = f" [{network_config.server}]" if multiple_networks else ""
+        self._handle_irc_message = coordinator.handle_irc_message
         self._is_first_connect = True
+        # Set once registered and joined; _start_irc_client only resets its backoff for such sessions.
+        self.joined_target_channel = False
 
     async def _register(self):
         """Ensure nickname list is initialized before registering."""
@@ -81,10 +157,11 @@ class IRCRelayClient(pydle.Client):
                 )
 
         await self.join(self.target_channel)
+        self.joined_target_channel = True
 
         # Optional Idlerpg LOGIN (global, but only when we're on the #idlerpg channel)
         settings = getattr(self.coordinator, "settings", None)
-        if settings and self.target_channel.lower() == "#idlerpg":
+        if settings and self._target_channel_key == "#idlerpg":
             idlerpg_user = getattr(settings, "idlerpg_username", None)
             idlerpg_pass = getattr(settings, "idlerpg_password", None)
             if idlerpg_user and idlerpg_pass:
@@ -104,14 +181,13 @@ class IRCRelayClient(pydle.Client):
 
     async def on_message(self, target, source, message):
         await super().on_message(target, source, message)
-        if target.casefold() != self.target_channel.casefold():
+        if target.casefold() != self._target_channel_key:
             return
         if source == self.nickname:
             # Ignore echoes of our own messages.
             return
         # Pass network identifier so messages can be distinguished
-        network_name = self.network_config.server
-        await self.coordinator.handle_irc_message(source, message, network_name=network_name)
+        await self._handle_irc_message(source, message, network_suffix=self._network_suffix)
 
     async def on_quit(self, user, message=None):
         await super().on_quit(user, message)
@@ -135,8 +211,7 @@ class IRCRelayClient(pydle.Client):
         except ValueError as e:
             # Handle cases where IRC server sends malformed messages
             # (e.g., JOIN messages with unexpected format)
-            error_str = str(e)
-            if "too many values to unpack" in error_str or "not enough values to unpack" in error_str:
+            if _error_message_contains(e, _UNPACK_ERROR_FRAGMENTS):
                 logger.debug("Ignoring malformed IRC message: %s (error: %s)", message, e)
                 return  # Don't re-raise, just ignore
             else:
@@ -153,8 +228,7 @@ class IRCRelayClient(pydle.Client):
             await super().on_raw_join(message)
         except (ValueError, TypeError) as e:
             # Handle malformed JOIN messages (e.g., wrong number of parameters)
-            error_str = str(e)
-            if "too many values to unpack" in error_str or "not enough values to unpack" in error_str or "unpack" in error_str.lower():
+            if _error_message_contains(e, ("unpack",)):
                 logger.debug("Ignoring malformed JOIN message: %s (error: %s)", message, e)
                 return  # Silently ignore malformed JOIN messages
             raise
@@ -175,6 +249,7 @@ class DiscordRelayBot(commands.Bot):
             help_command=None,
         )
         self.coordinator = coordinator
+        self._discord_channel_id = coordinator.settings.discord_channel_id
 
     async def setup_hook(self) -> None:
         await self.coordinator.on_discord_setup()
@@ -214,9 +289,7 @@ class DiscordRelayBot(commands.Bot):
         self.coordinator.record_error()
 
     async def on_message(self, message: discord.Message) -> None:
-        if message.author.bot:
-            return
-        if message.channel.id != self.coordinator.settings.discord_channel_id:
+        if message.author.bot or message.channel.id != self._discord_channel_id:
             return
         await self.coordinator.handle_discord_message(message)
         await self.process_commands(message)
@@ -230,34 +303,61 @@ class RelayCoordinator:
         self.config_store = ConfigStore(settings)
         self.discord_bot = DiscordRelayBot(self)
         self.irc_clients: list[IRCRelayClient] = [IRCRelayClient(self, network) for network in settings.irc_networks]
+        # Static per-network fields for health reports; only "connected" changes per probe.
+        self._irc_static_status = tuple(
+            {"server": network.server, "port": network.port, "channel": network.channel}
+            for network in settings.irc_networks
+        )
         self._discord_channel: Optional[discord.TextChannel] = None
+        self._channel_ready = asyncio.Event()
         self._discord_webhook: Optional[discord.Webhook] = None
+        self._url_webhook: Optional[discord.Webhook] = None
+        # Session owned by the coordinator for webhook requests (created in on_discord_setup).
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Caps in-flight webhook requests so bursts queue here instead of piling onto 429s.
+        self._webhook_semaphore = asyncio.Semaphore(WEBHOOK_MAX_CONCURRENCY)
         self._lock = asyncio.Lock()
         self._restart_task: Optional[asyncio.Task] = None
+        self.restart_requested = False
         self._guild_id: Optional[int] = settings.discord_guild_id
         self._slash_synced = False
+        self._online_announced = False
         # Health tracking
-        self._start_time = time.time()
+        # Monotonic timestamps: these are only ever used to compute durations.
+        self._start_time = time.monotonic()
         self._error_count = 0
         self._last_error_time: Optional[float] = None
         self._discord_reconnect_count = 0
         self._irc_reconnect_count = 0
         self._message_count = 0
         self._last_message_time: Optional[float] = None
+        self._dropped_message_count = 0
+        self._stats_cache: Optional[tuple[float, dict]] = None
+        # Bounded relay queues so slow peers don't stall the gateway receive loops.
+        # Each IRC network gets its own queue so one slow network can't hold up the rest.
+        self._irc_queues: list[asyncio.Queue[str]] = [
+            asyncio.Queue(maxsize=RELAY_QUEUE_MAXSIZE) for _ in self.irc_clients
+        ]
+        # Items are (author, content, network_suffix, is_quit); quit notices share the
+        # queue so they keep their order relative to the author's last lines.
+        self._to_discord_queue: asyncio.Queue[tuple[str, str, str, bool]] = asyncio.Queue(
+            maxsize=RELAY_QUEUE_MAXSIZE
+        )
+        self._relay_tasks: list[asyncio.Task] = []
 
     def get_uptime(self) -> float:
         """Get bot uptime in seconds."""
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
 
     def record_error(self) -> None:
         """Record an error occurrence."""
         self._error_count += 1
-        self._last_error_time = time.time()
+        self._last_error_time = time.monotonic()
 
     def record_message(self) -> None:
         """Record a message being relayed."""
         self._message_count += 1
-        self._last_message_time = time.time()
+        self._last_message_time = time.monotonic()
 
     def record_discord_reconnect(self) -> None:
         """Record a Discord reconnection."""
@@ -269,39 +369,22 @@ class RelayCoordinator:
 
     def _format_uptime(self, seconds: float) -> str:
         """Format uptime in seconds to human-readable string."""
-        if seconds < 0:
-            return "0s"
-        
-        days = int(seconds // 86400)
-        hours = int((seconds % 86400) // 3600)
-        minutes = int((seconds % 3600) // 60)
-        
-        parts = []
-        if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        
-        return " ".join(parts) if parts else "0s"
+        return _format_uptime_cached(int(max(seconds, 0)) // 60)
 
     def get_health_stats(self) -> dict:
-        """Get system health statistics."""
-        uptime_seconds = self.get_uptime()
+        """Get system health statistics (cached briefly so bursts of probes share one snapshot)."""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < HEALTH_STATS_TTL_SECONDS:
+            return self._stats_cache[1]
+        uptime_seconds = now - self._start_time
         uptime_hours = uptime_seconds / 3600
         uptime_days = uptime_seconds / 86400
         
         discord_ready = self.discord_bot.is_ready() if self.discord_bot else False
         irc_connected = any(client.connected for client in self.irc_clients) if self.irc_clients else False
         irc_networks_status = [
-            {
-                "server": client.network_config.server,
-                "port": client.network_config.port,
-                "channel": client.network_config.channel,
-                "connected": client.connected,
-            }
-            for client in self.irc_clients
+            {**static, "connected": client.connected}
+            for static, client in zip(self._irc_static_status, self.irc_clients)
         ]
         
         # Calculate message rate (messages per hour)
@@ -312,37 +395,129 @@ class RelayCoordinator:
         # Calculate time since last message
         time_since_last_message = None
         if self._last_message_time:
-            time_since_last_message = time.time() - self._last_message_time
+            time_since_last_message = now - self._last_message_time
         
         # Determine overall health status
         health_status = "healthy"
         if not discord_ready or not irc_connected:
             health_status = "degraded"
-        if self._error_count > 100 or (self._last_error_time and (time.time() - self._last_error_time) < 60):
+        if self._error_count > 100 or (self._last_error_time and (now - self._last_error_time) < 60):
             health_status = "unhealthy"
+
+        # Report the last error as a wall-clock timestamp, as before.
+        last_error_time = None
+        if self._last_error_time is not None:
+            last_error_time = time.time() - (now - self._last_error_time)
         
-        return {
+        stats = {
             "uptime_seconds": uptime_seconds,
             "uptime_hours": round(uptime_hours, 2),
             "uptime_days": round(uptime_days, 2),
             "uptime_formatted": self._format_uptime(uptime_seconds),
             "error_count": self._error_count,
-            "last_error_time": self._last_error_time,
+            "last_error_time": last_error_time,
             "discord_connected": discord_ready,
             "irc_connected": irc_connected,
             "irc_networks": irc_networks_status,
             "discord_reconnect_count": self._discord_reconnect_count,
             "irc_reconnect_count": self._irc_reconnect_count,
             "message_count": self._message_count,
+            "dropped_message_count": self._dropped_message_count,
             "message_rate_per_hour": round(message_rate, 2),
             "time_since_last_message": round(time_since_last_message, 2) if time_since_last_message else None,
             "health_status": health_status,
         }
+        self._stats_cache = (now, stats)
+        return stats
 
     async def on_discord_setup(self) -> None:
         logger.debug("Discord setup hook invoked")
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=WEBHOOK_TIMEOUT_SECONDS),
+            )
+
+    def _start_relay_workers(self) -> None:
+        """Start the queue drain workers once; safe to call on every ready event."""
+        if self._relay_tasks:
+            return
+        self._relay_tasks = [
+            asyncio.create_task(self._drain_to_discord(), name="relay-to-discord"),
+        ]
+
+    def _enqueue(self, queue: asyncio.Queue, item: Any, direction: str) -> None:
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._dropped_message_count += 1
+            self.record_error()
+            logger.warning("Relay queue to %s is full; dropping message.", direction)
+
+    async def _irc_sender(self, client_index: int) -> None:
+        """Drain one network's queue, pacing sends to stay under IRC flood limits."""
+        queue = self._irc_queues[client_index]
+        while True:
+            message = await queue.get()
+            # Look the client up each time: it is replaced when reconnecting.
+            client = self.irc_clients[client_index]
+            try:
+                if not client.connected:
+                    logger.warning(
+                        "Dropping message; IRC %s:%s is not connected.",
+                        client.network_config.server,
+                        client.network_config.port,
+                    )
+                    self.record_error()
+                    continue
+                await client.message(client.target_channel, message)
+            except Exception as e:
+                logger.error("Failed to send message to IRC %s:%s: %s", client.network_config.server, client.network_config.port, e)
+                self.record_error()
+            finally:
+                queue.task_done()
+            await asyncio.sleep(IRC_SEND_INTERVAL_SECONDS)
+
+    async def _drain_to_discord(self) -> None:
+        queue = self._to_discord_queue
+        pending: Optional[tuple[str, str, str, bool]] = None
+        while True:
+            if pending is None:
+                pending = await queue.get()
+            author, content, network_suffix, is_quit = pending
+            pending = None
+            if is_quit:
+                try:
+                    await self._deliver_irc_quit(author, content)
+                except Exception:
+                    logger.exception("Failed to relay IRC quit to Discord")
+                    self.record_error()
+                finally:
+                    queue.task_done()
+                continue
+            # Give the author a short window to keep talking, then fold their
+            # consecutive lines into one Discord send to spare the rate limit.
+            await asyncio.sleep(IRC_COALESCE_WINDOW_SECONDS)
+            lines = [content]
+            length = len(content)
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item[3] or item[0] != author or item[2] != network_suffix or length + 1 + len(item[1]) > DISCORD_MESSAGE_LIMIT:
+                    pending = item
+                    break
+                lines.append(item[1])
+                length += 1 + len(item[1])
+            try:
+                await self._deliver_irc_message(author, "\n".join(lines), network_suffix)
+            except Exception:
+                logger.exception("Failed to relay IRC message to Discord")
+                self.record_error()
+            finally:
+                for _ in lines:
+                    queue.task_done()
 
     async def on_discord_ready(self) -> None:
+        self._start_relay_workers()
         if self._discord_channel is None:
             # Check if channel ID is placeholder - if so, skip silently
             if self.settings.discord_channel_id == 123456789012345678:
@@ -375,13 +550,17 @@ class RelayCoordinator:
                 )
                 return
             self._discord_channel = channel
+            self._channel_ready.set()
             guild = channel.guild
             guild_name = guild.name if guild else "Unknown"
             logger.info("Bridging Discord server '%s' (%s) channel #%s (%s)", guild_name, guild.id if guild else "N/A", channel.name, channel.id)
+        # Announce once per process, not on every gateway reconnect/resume.
+        if self._discord_channel is not None and not self._online_announced:
+            self._online_announced = True
             try:
-                await channel.send("🔗 IRC relay is online.")
+                await self._discord_channel.send("🔗 IRC relay is online.")
             except discord.Forbidden:
-                logger.warning("Bot cannot send messages to channel #%s. Check permissions.", channel.name)
+                logger.warning("Bot cannot send messages to channel #%s. Check permissions.", self._discord_channel.name)
         if not self._slash_synced:
             # Only sync if we have a valid channel
             if self._discord_channel is not None:
@@ -410,63 +589,84 @@ class RelayCoordinator:
 
     async def handle_discord_message(self, message: discord.Message) -> None:
         self.record_message()
-        content_parts = []
-        if message.clean_content:
-            content_parts.append(message.clean_content)
+        # clean_content is recomputed on every access, so read it once.
+        # Discord already trims message content, so no strip pass is needed.
+        content = message.clean_content
         if message.attachments:
-            attachment_urls = " ".join(attachment.url for attachment in message.attachments)
-            content_parts.append(f"[attachments] {attachment_urls}")
-        content = "\n".join(part for part in content_parts if part).strip()
-        if not content:
+            attachment_line = "[attachments] " + " ".join(attachment.url for attachment in message.attachments)
+            content = f"{content}\n{attachment_line}" if content else attachment_line
+        elif not content:
             return
-        prefix = f"<{message.author.display_name}>"
-        await self.send_to_irc(f"{prefix} {content}")
+        await self.send_to_irc(f"<{message.author.display_name}> {content}")
 
-    async def handle_irc_message(self, author: str, content: str, network_name: Optional[str] = None) -> None:
+    async def handle_irc_message(self, author: str, content: str, network_suffix: str = "") -> None:
+        """Queue an IRC line for Discord; network_suffix is the precomputed " [server]" tag."""
         self.record_message()
+        self._enqueue(self._to_discord_queue, (author, content, network_suffix, False), "Discord")
+
+    async def _deliver_irc_message(self, author: str, content: str, network_suffix: str) -> None:
         channel = await self._ensure_discord_channel()
-        author_label = author.strip()
-        allowed_mentions = discord.AllowedMentions.none()
-        
-        # If multiple IRC networks, include network identifier in username
-        # Only show network if there are multiple networks configured
-        has_multiple_networks = len(self.irc_clients) > 1
-        if has_multiple_networks and network_name:
-            # Format username to include network: "User [Network]"
-            username = f"{author_label} [{network_name}]" if author_label else f"IRC [{network_name}]"
-        else:
-            username = author_label or "IRC"
-        
+        # Format username to include network when several are bridged: "User [Network]"
+        username = (author.strip() or "IRC") + network_suffix
+
         webhook = await self._ensure_discord_webhook(channel)
         if webhook is not None:
-            await webhook.send(
-                content,
-                username=username,
-                allowed_mentions=allowed_mentions,
-            )
-        else:
-            formatted = f"**<{username}>** {content}"
-            await channel.send(formatted, allowed_mentions=allowed_mentions)
+            try:
+                async with self._webhook_semaphore:
+                    await webhook.send(
+                        content,
+                        username=username,
+                        allowed_mentions=_NO_MENTIONS,
+                    )
+                return
+            except discord.NotFound:
+                # Webhook was deleted; rediscover next time, and use a bot message for this one.
+                logger.warning("Relay webhook no longer exists; falling back to bot messages until recreated.")
+                await self._forget_discord_webhook()
+        formatted = f"**<{username}>** {content}"
+        await channel.send(formatted, allowed_mentions=_NO_MENTIONS)
 
     async def handle_irc_quit(self, author: str, reason: str) -> None:
+        """Queue a quit notice for Discord, like handle_irc_message, off pydle's receive path."""
+        self._enqueue(self._to_discord_queue, (author, reason, "", True), "Discord")
+
+    async def _deliver_irc_quit(self, author: str, reason: str) -> None:
         channel = await self._ensure_discord_channel()
-        allowed_mentions = discord.AllowedMentions.none()
         author_label = author.strip() or "IRC user"
         parts = [f"🔌 **{author_label}** left IRC"]
         reason = reason.strip()
         if reason:
             parts.append(f"— {reason}")
-        await channel.send(" ".join(parts), allowed_mentions=allowed_mentions)
+        await channel.send(" ".join(parts), allowed_mentions=_NO_MENTIONS)
 
     async def announce_football_event(self, summary: str) -> None:
         channel = await self._ensure_discord_channel()
-        await channel.send(summary)
-        await self.send_to_irc(summary)
-        await self.send_to_discord_webhook(summary)
+        # The three targets are independent, so fan out concurrently and let a
+        # failure in one (e.g. the webhook) not cancel the others.
+        results = await asyncio.gather(
+            channel.send(summary),
+            self.send_to_irc(summary),
+            self.send_to_discord_webhook(summary),
+            return_exceptions=True,
+        )
+        for target, result in zip(("Discord channel", "IRC", "Discord webhook"), results):
+            if isinstance(result, Exception):
+                logger.error("Failed to deliver football announcement to %s: %s", target, result)
+                self.record_error()
 
     async def _ensure_discord_channel(self) -> discord.TextChannel:
-        if self._discord_channel is not None:
-            return self._discord_channel
+        # Hot path: a single attribute read once the channel is known.
+        channel = self._discord_channel
+        if channel is not None:
+            return channel
+        if not self.discord_bot.is_ready():
+            # on_discord_ready resolves the channel; wait for it rather than racing it
+            # with a REST fetch, then fall back to fetching under the lock.
+            try:
+                await asyncio.wait_for(self._channel_ready.wait(), timeout=CHANNEL_READY_TIMEOUT_SECONDS)
+                return self._discord_channel
+            except asyncio.TimeoutError:
+                pass
         async with self._lock:
             if self._discord_channel is None:
                 # Check if channel ID is placeholder - if so, raise a clear error
@@ -494,6 +694,7 @@ class RelayCoordinator:
                         f"Configured channel ID {self.settings.discord_channel_id} is not a text channel."
                     )
                 self._discord_channel = channel
+                self._channel_ready.set()
                 self._guild_id = channel.guild.id
         return self._discord_channel
 
@@ -507,18 +708,19 @@ class RelayCoordinator:
             channel = await self._ensure_discord_channel()
         # Prefer user-provided webhook URL if available.
         if self.settings.discord_webhook_url:
-            try:
-                session = self.discord_bot.http._HTTPClient__session  # type: ignore[attr-defined]
-            except AttributeError:
-                session = None
-            if session is None:
-                return None
-            self._discord_webhook = discord.Webhook.from_url(
-                self.settings.discord_webhook_url,
-                session=session,
-            )
+            self._discord_webhook = self._get_url_webhook()
             return self._discord_webhook
 
+        # Reuse the webhook remembered from a previous run to skip listing the channel's webhooks.
+        stored = await self.config_store.get_relay_webhook()
+        session = self._get_http_session()
+        if session is not None and stored.get("channel_id") == str(channel.id) and stored.get("id") and stored.get("token"):
+            try:
+                self._discord_webhook = discord.Webhook.partial(int(stored["id"]), stored["token"], session=session)
+                return self._discord_webhook
+            except ValueError:
+                await self.config_store.clear_relay_webhook()
+
         try:
             existing = await channel.webhooks()
         except discord.Forbidden:
@@ -541,8 +743,36 @@ class RelayCoordinator:
             except discord.HTTPException:
                 logger.exception("Failed to create webhook for channel %s", channel.id)
 
+        if self._discord_webhook is not None and self._discord_webhook.token:
+            await self.config_store.set_relay_webhook(channel.id, self._discord_webhook.id, self._discord_webhook.token)
         return self._discord_webhook
 
+    async def _forget_discord_webhook(self) -> None:
+        """Drop a webhook that Discord no longer knows so the next send rediscovers one."""
+        self._discord_webhook = None
+        await self.config_store.clear_relay_webhook()
+
+    def _get_http_session(self) -> Optional[aiohttp.ClientSession]:
+        """Return the coordinator's pooled webhook session, or None before Discord setup."""
+        if self._http_session is None or self._http_session.closed:
+            return None
+        return self._http_session
+
+    def _get_url_webhook(self) -> Optional[discord.Webhook]:
+        """Return a webhook for DISCORD_WEBHOOK_URL bound to the coordinator's HTTP session."""
+        if self._url_webhook is not None:
+            return self._url_webhook
+        if not self.settings.discord_webhook_url:
+            return None
+        session = self._get_http_session()
+        if session is None:
+            return None
+        self._url_webhook = discord.Webhook.from_url(
+            self.settings.discord_webhook_url,
+            session=session,
+        )
+        return self._url_webhook
+
     async def ensure_guild_id(self) -> Optional[int]:
         if self._guild_id is not None:
             return self._guild_id
@@ -551,31 +781,35 @@ class RelayCoordinator:
         return self._guild_id
 
     async def send_to_irc(self, message: str) -> None:
-        """Send message to all connected IRC networks."""
+        """Queue message for every connected IRC network without waiting on the sockets."""
         sent_to_any = False
-        for client in self.irc_clients:
+        for client, queue in zip(self.irc_clients, self._irc_queues):
             if client.connected:
-                try:
-                    await client.message(client.target_channel, message)
-                    sent_to_any = True
-                except Exception as e:
-                    logger.error("Failed to send message to IRC %s:%s: %s", client.network_config.server, client.network_config.port, e)
-                    self.record_error()
-        
+                self._enqueue(queue, message, f"IRC {client.network_config.server}")
+                sent_to_any = True
+
         if not sent_to_any:
             logger.warning("Dropping message; no IRC clients connected: %s", message)
             self.record_error()
 
     async def stop_irc(self) -> bool:
         """Stop all IRC clients."""
+        clients = [client for client in self.irc_clients if client.connected]
+        results = await asyncio.gather(
+            *(client.quit(message="IRC relay disconnected via command") for client in clients),
+            return_exceptions=True,
+        )
         stopped_any = False
-        for client in self.irc_clients:
-            if client.connected:
-                try:
-                    await client.quit(message="IRC relay disconnected via command")
-                    stopped_any = True
-                except Exception:  # pragma: no cover - operational logging
-                    logger.exception("Failed to disconnect from IRC %s:%s on command.", client.network_config.server, client.network_config.port)
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):  # pragma: no cover - operational logging
+                logger.error(
+                    "Failed to disconnect from IRC %s:%s on command.",
+                    client.network_config.server,
+                    client.network_config.port,
+                    exc_info=result,
+                )
+            else:
+                stopped_any = True
         return stopped_any
 
     async def send_to_discord_webhook(
@@ -587,18 +821,18 @@ class RelayCoordinator:
     ) -> None:
         if not self.settings.discord_webhook_url:
             return
+        webhook = self._get_url_webhook()
+        if webhook is None:
+            logger.warning("Discord HTTP session not ready; skipping webhook delivery.")
+            return
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    self.settings.discord_webhook_url,
-                    json={
-                        "content": message,
-                        "username": username,
-                        "avatar_url": avatar_url,
-                    },
+            async with self._webhook_semaphore:
+                await webhook.send(
+                    message,
+                    username=username or discord.utils.MISSING,
+                    avatar_url=avatar_url or discord.utils.MISSING,
                 )
-                response.raise_for_status()
-        except httpx.HTTPError:
+        except (discord.HTTPException, aiohttp.ClientError, asyncio.TimeoutError):
             logger.exception("Failed to deliver message to Discord webhook.")
 
     async def reload_runtime(self) -> None:
@@ -620,14 +854,25 @@ class RelayCoordinator:
         if self._restart_task and not self._restart_task.done():
             return
 
+        # Leave relaunching to the process supervisor (systemd, Docker, ...):
+        # shutting down ends main_async, which then exits with RESTART_EXIT_CODE.
+        self.restart_requested = True
+
         async def _perform_restart() -> None:
-            try:
-                await self.shutdown()
-            finally:
-                os.execv(sys.executable, [sys.executable, "-m", "src.main"])
+            await self._flush_relay_queues(timeout=5.0)
+            await self.shutdown()
 
         self._restart_task = asyncio.create_task(_perform_restart())
 
+    async def _flush_relay_queues(self, timeout: float) -> None:
+        """Give queued relay messages a bounded chance to go out before shutting down."""
+        queues = [*self._irc_queues, self._to_discord_queue]
+        try:
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in queues)), timeout=timeout)
+        except asyncio.TimeoutError:
+            pending = sum(queue.qsize() for queue in queues)
+            logger.warning("Restarting with %d relay messages still queued.", pending)
+
     async def start_discord(self) -> None:
         await self.discord_bot.start(self.settings.discord_token)
 
@@ -647,11 +892,11 @@ class RelayCoordinator:
 
     async def start_irc(self) -> None:
         """Start all IRC clients with proper error handling."""
-        # Start each IRC client in its own task
+        # Start each IRC client and its outbound sender in their own tasks
         tasks = []
         for i, client in enumerate(self.irc_clients):
-            task = asyncio.create_task(self._start_irc_client(i))
-            tasks.append(task)
+            tasks.append(asyncio.create_task(self._start_irc_client(i)))
+            tasks.append(asyncio.create_task(self._irc_sender(i)))
         
         # Wait for all tasks (they run forever until cancelled)
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -660,9 +905,12 @@ class RelayCoordinator:
         """Start a single IRC client with proper error handling."""
         client = self.irc_clients[client_index]
         network_config = self.settings.irc_networks[client_index]
+        # Consecutive failed attempts, used for reconnect backoff; reset after a healthy session.
+        attempt = 0
         
         try:
             while True:
+                read_conflict = False
                 try:
                     if not client.connected:
                         await client.connect(
@@ -672,6 +920,8 @@ class RelayCoordinator:
                             password=getattr(network_config, "password", None),
                         )
                     await client.handle_forever()
+                    # pydle returns normally (rather than raising) when the server closes the link
+                    logger.warning("IRC connection closed by %s:%s, reconnecting...", network_config.server, network_config.port)
                 except asyncio.CancelledError:
                     logger.info("IRC client task %s:%s cancelled", network_config.server, network_config.port)
                     # Ensure client is disconnected before exiting
@@ -681,41 +931,26 @@ class RelayCoordinator:
                     except Exception:
                         pass
                     raise  # Re-raise to properly propagate cancellation
-                except (ConnectionResetError, OSError) as e:
-                    logger.warning("IRC connection lost %s:%s (%s), reconnecting...", network_config.server, network_config.port, type(e).__name__)
-                    await self._recreate_irc_client(client_index)
-                    client = self.irc_clients[client_index]
-                    await asyncio.sleep(5)
-                    continue
-                except RuntimeError as e:
-                    error_str = str(e)
-                    if "readuntil() called while another coroutine is already waiting" in error_str:
-                        # This is a known pydle concurrency issue with multiple IRC clients - suppress it
+                except Exception as e:
+                    # Classify once; the client is recreated below either way
+                    read_conflict = _is_read_conflict(e)
+                    if read_conflict:
                         logger.debug("IRC read conflict detected %s:%s, recreating client...", network_config.server, network_config.port)
-                        await self._recreate_irc_client(client_index)
-                        client = self.irc_clients[client_index]
-                        await asyncio.sleep(2)
-                        continue
+                    elif isinstance(e, OSError):
+                        logger.warning("IRC connection lost %s:%s (%s), reconnecting...", network_config.server, network_config.port, type(e).__name__)
                     else:
-                        logger.warning("RuntimeError in IRC client %s:%s: %s", network_config.server, network_config.port, error_str)
-                        await self._recreate_irc_client(client_index)
-                        client = self.irc_clients[client_index]
-                        await asyncio.sleep(5)
-                        continue
-                except Exception as e:
-                    error_str = str(e)
-                    # Also check for readuntil errors that might be caught as generic Exception
-                    if "readuntil() called while another coroutine is already waiting" in error_str:
-                        logger.debug("IRC read conflict (generic Exception) %s:%s, recreating client...", network_config.server, network_config.port)
-                        await self._recreate_irc_client(client_index)
-                        client = self.irc_clients[client_index]
-                        await asyncio.sleep(2)
-                        continue
-                    logger.warning("Error in IRC client %s:%s: %s", network_config.server, network_config.port, error_str)
-                    await self._recreate_irc_client(client_index)
-                    client = self.irc_clients[client_index]
-                    await asyncio.sleep(5)
-                    continue
+                        logger.warning("%s in IRC client %s:%s: %s", type(e).__name__, network_config.server, network_config.port, e)
+                # A server that accepts the connection and drops it before we join
+                # (throttling, K-lines) keeps backing off like a failed connect.
+                if client.joined_target_channel:
+                    attempt = 0
+                await self._recreate_irc_client(client_index)
+                client = self.irc_clients[client_index]
+                if read_conflict:
+                    await asyncio.sleep(_READ_CONFLICT_RETRY_SECONDS)
+                else:
+                    await asyncio.sleep(_reconnect_delay(attempt))
+                    attempt += 1
         except asyncio.CancelledError:
             # Ensure cleanup on cancellation
             try:
@@ -725,59 +960,72 @@ class RelayCoordinator:
                 pass
             raise
 
-    async def shutdown(self) -> None:
-        """Shutdown all services cleanly."""
-        # Close Discord bot first (this should close all aiohttp sessions)
-        if not self.discord_bot.is_closed():
-            try:
-                # Close the bot and wait for it to complete
-                await asyncio.wait_for(self.discord_bot.close(), timeout=10.0)
-            except asyncio.TimeoutError:
-                logger.warning("Discord bot close timeout")
-            except Exception as e:
-                logger.warning("Error closing Discord bot: %s", e)
-        
-        # Close all IRC clients
-        disconnect_tasks = []
+    async def _close_discord_bot(self) -> None:
+        if self.discord_bot.is_closed():
+            return
+        try:
+            await asyncio.wait_for(self.discord_bot.close(), timeout=10.0)
+        except asyncio.TimeoutError:
+            logger.warning("Discord bot close timeout")
+        except Exception as e:
+            logger.warning("Error closing Discord bot: %s", e)
+
+    async def _quit_irc_clients(self) -> None:
+        disconnect_tasks: dict[asyncio.Task, IRCRelayClient] = {}
         for client in self.irc_clients:
             if client.connected:
                 try:
-                    # Disconnect the client
                     task = asyncio.create_task(client.quit(message="Relay shutting down"))
-                    disconnect_tasks.append(task)
+                    disconnect_tasks[task] = client
                 except Exception as e:
                     logger.warning("Error disconnecting IRC client %s:%s: %s", 
                                  client.network_config.server, client.network_config.port, e)
-        
-        # Wait for all IRC disconnections to complete (with timeout)
-        if disconnect_tasks:
-            try:
-                await asyncio.wait_for(asyncio.gather(*disconnect_tasks, return_exceptions=True), timeout=5.0)
-            except asyncio.TimeoutError:
-                logger.warning("IRC disconnection timeout, forcing disconnect")
-                # Force disconnect remaining clients
-                for client in self.irc_clients:
-                    if client.connected:
-                        try:
-                            await client.disconnect(expected=True)
-                        except Exception:
-                            pass
-        
-        # Ensure aiohttp sessions are closed (discord.py should handle this, but be explicit)
+        if not disconnect_tasks:
+            return
+
+        # asyncio.wait leaves the quits running on timeout (unlike wait_for over a
+        # gather), so only the clients that are actually stuck get forced off.
+        done, pending = await asyncio.wait(disconnect_tasks, timeout=5.0)
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                client = disconnect_tasks[task]
+                logger.warning("Error disconnecting IRC client %s:%s: %s",
+                             client.network_config.server, client.network_config.port, task.exception())
+        if pending:
+            logger.warning("IRC disconnection timeout, forcing disconnect")
+            for task in pending:
+                task.cancel()
+                try:
+                    await disconnect_tasks[task].disconnect(expected=True)
+                except Exception:
+                    pass
+
+    async def shutdown(self) -> None:
+        """Shutdown all services cleanly."""
+        for task in self._relay_tasks:
+            task.cancel()
+        if self._relay_tasks:
+            await asyncio.gather(*self._relay_tasks, return_exceptions=True)
+            self._relay_tasks = []
+
+        # Discord and IRC are independent; close both at once (each logs its own failures)
+        await asyncio.gather(self._close_discord_bot(), self._quit_irc_clients())
+
+        # Flush after closing so changes made while closing are written too; a
+        # writer task started now would be cancelled by main's task cleanup.
         try:
-            if hasattr(self.discord_bot, 'http'):
-                http_client = self.discord_bot.http
-                # Try to get the session - discord.py uses different internal structures
-                if hasattr(http_client, '_HTTPClient__session'):
-                    session = http_client._HTTPClient__session
-                    if session and not session.closed:
-                        await session.close()
-                # Also try to close connector if it exists
-                if hasattr(http_client, '_HTTPClient__connector'):
-                    connector = http_client._HTTPClient__connector
-                    if connector and not connector.closed:
-                        await connector.close()
+            await self.config_store.flush()
         except Exception as e:
-            logger.debug("Error closing aiohttp session: %s", e)
+            logger.warning("Error flushing config store: %s", e)
+
+        # discord_bot.close() owns and closes discord.py's aiohttp session; only
+        # the session the relay created for webhooks is closed here.
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+
+        # Cached webhooks are bound to the sessions closed above; drop them so a
+        # later reconnect builds fresh ones on the new pooled session.
+        self._url_webhook = None
+        self._discord_webhook = None
 
 
@@ -3,30 +3,115 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-import json
+import hashlib
+import logging
+import os
+import sys
+from collections import deque
+from contextlib import suppress
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+import orjson
 
 from .config import Settings
 
+logger = logging.getLogger(__name__)
+
+# Mutations within this window are written to disk together.
+PERSIST_DEBOUNCE_SECONDS = 0.5
+# After failed writes the writer waits exponentially longer, up to this cap.
+PERSIST_RETRY_MAX_SECONDS = 60.0
+MODERATION_LOG_LIMIT = 1000
+MONITOR_HISTORY_LIMIT = 100
+USER_WARNING_LIMIT = 100
+# Int-keyed sections (credits, warnings) are dumped as-is; keys are sorted
+# after being stringified, so the output matches str-keyed dicts.
+_DUMP_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# Small config sections stay in the main state file, which the Ruby bot also
+# reads; moderation_logs stays there too because the Ruby bot reads and writes it.
+_SHARED_SECTIONS = (
+    "monitor_urls",
+    "monitor_metadata",
+    "rss_feeds",
+    "credits",
+    "football_defaults",
+    "feature_flags",
+    "znc_config",
+    "bluesky_config",
+    "router_config",
+    "relay_webhook",
+    "moderation_logs",
+)
+# Key prefixes for splicing cached section encodings into the main file, in
+# the order OPT_SORT_KEYS would produce.
+_SHARED_SECTION_KEYS = tuple((name, b'"%s":' % name.encode()) for name in sorted(_SHARED_SECTIONS))
+# Large, frequently appended sections each get their own file next to it.
+_SEPARATE_SECTIONS = ("monitor_history", "user_warnings")
+# These are JSON Lines files: each new entry is appended as one line, and the
+# file is compacted once it holds twice what is kept in memory. Encoding and
+# compaction are specific to monitor_history, the only such section.
+_JSONL_SECTIONS = ("monitor_history",)
+
+
+def _tail(items: deque, limit: int) -> list:
+    """Return the last ``limit`` items, oldest first, walking only those items."""
+    if limit <= 0:
+        return []
+    tail = list(islice(reversed(items), limit))
+    tail.reverse()
+    return tail
+
 
 class ConfigStore:
-    """Persist dynamic configuration such as monitor URLs and RSS feeds."""
+    """Persist dynamic configuration such as monitor URLs and RSS feeds.
+
+    Getters return read-only views or tuples rather than copies; callers that
+    need to modify the result must copy it themselves.
+    """
 
     def __init__(self, settings: Settings, path: Path | None = None) -> None:
-        self._lock = asyncio.Lock()
+        # State is only touched from the event loop and no accessor awaits, so
+        # only the disk writes need locks: one per file, so unrelated sections
+        # are written in parallel. Sections changed since the last write are
+        # flushed by ``_writer_task``.
+        self._dirty: set[str] = set()
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        # Consecutive failed writes and the last error, so retries back off and
+        # a persistent failure is logged once rather than on every retry
+        self._persist_failures = 0
+        self._last_persist_error: Optional[str] = None
         self._path = path or Path("data/config_state.json")
         self._path.parent.mkdir(parents=True, exist_ok=True)
-
-        self._monitor_urls: list[str] = list(settings.monitor_urls)
+        self._file_locks: dict[Path, asyncio.Lock] = {self._path: asyncio.Lock()}
+        # Digest of each file as last read or written, so unchanged files are not reparsed
+        self._file_digests: dict[Path, bytes] = {}
+        # Encoded shared sections, reused until _mark_dirty names the section again
+        self._encoded_sections: dict[str, bytes] = {}
+        # JSON Lines bookkeeping: entries not yet appended, sections that must be
+        # rewritten (entries were removed), and the line count of each file
+        self._appended: dict[str, list[Any]] = {name: [] for name in _JSONL_SECTIONS}
+        self._needs_rewrite: set[str] = set()
+        self._disk_lines: dict[str, int] = dict.fromkeys(_JSONL_SECTIONS, 0)
+        for name in _SEPARATE_SECTIONS:
+            self._file_locks[self._section_path(name)] = asyncio.Lock()
+
+        # URL collections are insertion-ordered dicts used as ordered sets
+        self._monitor_urls: dict[str, None] = dict.fromkeys(settings.monitor_urls)
         self._monitor_metadata: dict[str, dict[str, Any]] = {}
-        self._monitor_history: dict[str, list[dict[str, Any]]] = {}
-        self._rss_feeds: list[str] = list(settings.rss_feeds)
-        self._credits: dict[str, int] = {}
+        self._monitor_history: dict[str, deque[dict[str, Any]]] = {}
+        self._rss_feeds: dict[str, None] = dict.fromkeys(settings.rss_feeds)
+        # Keyed by user ID; stringified only at the JSON boundary
+        self._credits: dict[int, int] = {}
         self._football_defaults: dict[str, str] = {}
         self._znc_config: dict[str, str] = {}
         self._bluesky_config: dict[str, str] = {}
         self._router_config: dict[str, str] = {}
+        # Webhook the relay created/discovered: {"channel_id", "id", "token"}
+        self._relay_webhook: dict[str, str] = {}
         self._feature_flags: dict[str, bool] = {
             "games": True,
             "music": True,
@@ -38,26 +123,160 @@ class ConfigStore:
             "znc": True,
         }
         # Store moderation logs (max 1000 entries)
-        self._moderation_logs: list[dict] = []
-        # Store user warnings/strikes: {guild_id: {user_id: [warnings]}}
-        self._user_warnings: dict[str, dict[str, list[dict]]] = {}
+        self._moderation_logs: deque[dict] = deque(maxlen=MODERATION_LOG_LIMIT)
+        # Store user warnings/strikes: {guild_id: {user_id: [warnings]}}, newest
+        # USER_WARNING_LIMIT kept per user
+        self._user_warnings: dict[int, dict[int, deque[dict]]] = {}
 
         self._load()
 
     # ---------------------------------------------------------------------
     # Internal helpers
     # ---------------------------------------------------------------------
-    def _load(self) -> None:
-        if not self._path.exists():
-            return
+    def _section_path(self, name: str, suffix: Optional[str] = None) -> Path:
+        if suffix is None:
+            suffix = ".jsonl" if name in _JSONL_SECTIONS else self._path.suffix
+        return self._path.with_name(f"{self._path.stem}.{name}{suffix}")
+
+    def _section_state(self, name: str) -> Any:
+        if name in ("monitor_urls", "rss_feeds", "moderation_logs"):
+            return list(getattr(self, f"_{name}"))
+        if name == "user_warnings":
+            return {
+                guild_id: {user_id: list(warnings) for user_id, warnings in users.items()}
+                for guild_id, users in self._user_warnings.items()
+            }
+        return getattr(self, f"_{name}")
+
+    def _encode_shared_state(self) -> bytes:
+        """Encode the main file, re-encoding only sections changed since the last write.
+
+        The output is identical to dumping the whole dict with _DUMP_OPTIONS.
+        """
+        parts: list[bytes] = []
+        for name, key in _SHARED_SECTION_KEYS:
+            encoded = self._encoded_sections.get(name)
+            if encoded is None:
+                encoded = orjson.dumps(self._section_state(name), option=_DUMP_OPTIONS)
+                self._encoded_sections[name] = encoded
+            parts.append(key + encoded)
+        return b"{" + b",".join(parts) + b"}"
+
+    def _monitor_history_lines(self) -> list[bytes]:
+        return [
+            orjson.dumps([url, sample])
+            for url, entries in self._monitor_history.items()
+            for sample in entries
+        ]
+
+    def _monitor_history_compaction_threshold(self) -> int:
+        kept = sum(len(entries) for entries in self._monitor_history.values())
+        return 2 * max(kept, MONITOR_HISTORY_LIMIT)
+
+    @staticmethod
+    def _join_lines(lines: list[bytes]) -> bytes:
+        return b"".join(line + b"\n" for line in lines)
+
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        return hashlib.blake2s(data, digest_size=16).digest()
+
+    def _read_json(self, path: Path) -> Any:
+        """Parse ``path``; None if it is missing, invalid or unchanged since last seen."""
         try:
-            payload = json.loads(self._path.read_text())
-        except (OSError, json.JSONDecodeError):
-            return
+            data = path.read_bytes()
+        except OSError:
+            return None
+        digest = self._digest(data)
+        if self._file_digests.get(path) == digest:
+            return None
+        try:
+            payload = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return None
+        self._file_digests[path] = digest
+        return payload
+
+    def _read_jsonl(self, path: Path) -> Optional[tuple[list[Any], bool]]:
+        """Parse a JSON Lines file into (records, intact); None if missing or unchanged.
+
+        Torn or corrupt lines are skipped and reported through ``intact``.
+        """
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        digest = self._digest(data)
+        if self._file_digests.get(path) == digest:
+            return None
+        records: list[Any] = []
+        intact = not data or data.endswith(b"\n")
+        for line in data.splitlines():
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                intact = False
+        self._file_digests[path] = digest
+        return records, intact
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Never leave a half-written temp file behind (e.g. on a full disk)
+            with suppress(OSError):
+                tmp_path.unlink()
+            raise
+
+    @staticmethod
+    def _append(path: Path, data: bytes) -> None:
+        with open(path, "ab") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _load(self) -> None:
+        self._encoded_sections.clear()
+        payload = self._read_json(self._path)
+        if not isinstance(payload, dict):
+            payload = {}
+
+        # Large sections live in their own files; older state files kept them inline.
+        migrate: list[str] = []
+        for name in _SEPARATE_SECTIONS:
+            section_path = self._section_path(name)
+            if section_path.exists():
+                if name in _JSONL_SECTIONS:
+                    section = self._load_jsonl_section(name, section_path)
+                else:
+                    section = self._read_json(section_path)
+                # The section file wins over any inline copy, even when it is unchanged
+                if section is None:
+                    payload.pop(name, None)
+                else:
+                    payload[name] = section
+                continue
+            if name in _JSONL_SECTIONS:
+                # Before JSON Lines these sections were plain .json section files
+                legacy = self._read_json(self._section_path(name, self._path.suffix))
+                if legacy is not None:
+                    payload[name] = legacy
+            if name in payload:
+                migrate.append(name)
 
         monitor_urls = payload.get("monitor_urls")
         if isinstance(monitor_urls, list):
-            self._monitor_urls = [str(item).strip() for item in monitor_urls if str(item).strip()]
+            # URLs are interned so the URL list and both monitor dicts share one
+            # string per URL instead of each holding its own parsed copy
+            self._monitor_urls = dict.fromkeys(
+                sys.intern(str(item).strip()) for item in monitor_urls if str(item).strip()
+            )
 
         monitor_metadata = payload.get("monitor_metadata")
         if isinstance(monitor_metadata, dict):
@@ -65,7 +284,7 @@ class ConfigStore:
             for key, meta in monitor_metadata.items():
                 if not isinstance(meta, dict):
                     continue
-                normalized_meta[str(key)] = {
+                normalized_meta[sys.intern(str(key))] = {
                     k: meta[k]
                     for k in ("keyword", "expected_status", "verify_tls")
                     if k in meta
@@ -74,27 +293,27 @@ class ConfigStore:
 
         monitor_history = payload.get("monitor_history")
         if isinstance(monitor_history, dict):
-            normalized_history: dict[str, list[dict[str, Any]]] = {}
-            for key, entries in monitor_history.items():
-                if not isinstance(entries, list):
-                    continue
-                normalized_entries: list[dict[str, Any]] = []
-                for entry in entries[-100:]:
-                    if isinstance(entry, dict):
-                        normalized_entries.append(entry)
-                normalized_history[str(key)] = normalized_entries
-            self._monitor_history = normalized_history
+            self._monitor_history = {
+                sys.intern(str(key)): deque(
+                    (entry for entry in entries[-MONITOR_HISTORY_LIMIT:] if isinstance(entry, dict)),
+                    maxlen=MONITOR_HISTORY_LIMIT,
+                )
+                for key, entries in monitor_history.items()
+                if isinstance(entries, list)
+            }
 
         rss_feeds = payload.get("rss_feeds")
         if isinstance(rss_feeds, list):
-            self._rss_feeds = [str(item).strip() for item in rss_feeds if str(item).strip()]
+            self._rss_feeds = dict.fromkeys(
+                str(item).strip() for item in rss_feeds if str(item).strip()
+            )
 
         credits = payload.get("credits")
         if isinstance(credits, dict):
-            normalized: dict[str, int] = {}
+            normalized: dict[int, int] = {}
             for key, value in credits.items():
                 try:
-                    normalized[str(int(key))] = int(value)
+                    normalized[int(key)] = int(value)
                 except (ValueError, TypeError):
                     continue
             self._credits = normalized
@@ -139,54 +358,184 @@ class ConfigStore:
                 if isinstance(key, str) and isinstance(value, (str, int))
             }
 
+        relay_webhook = payload.get("relay_webhook")
+        if isinstance(relay_webhook, dict):
+            self._relay_webhook = {
+                str(key): str(value)
+                for key, value in relay_webhook.items()
+                if key in ("channel_id", "id", "token") and isinstance(value, (str, int))
+            }
+
         moderation_logs = payload.get("moderation_logs")
         if isinstance(moderation_logs, list):
-            # Keep only last 1000 entries
-            self._moderation_logs = moderation_logs[-1000:]
+            self._moderation_logs = deque(
+                moderation_logs[-MODERATION_LOG_LIMIT:], maxlen=MODERATION_LOG_LIMIT
+            )
 
         user_warnings = payload.get("user_warnings")
         if isinstance(user_warnings, dict):
-            self._user_warnings = {
-                str(guild_id): {
-                    str(user_id): list(warnings) if isinstance(warnings, list) else []
-                    for user_id, warnings in users.items()
-                }
-                for guild_id, users in user_warnings.items()
-            }
-
-    async def _persist(self) -> None:
-        state = {
-            "monitor_urls": self._monitor_urls,
-            "monitor_metadata": self._monitor_metadata,
-            "monitor_history": self._monitor_history,
-            "rss_feeds": self._rss_feeds,
-            "credits": self._credits,
-            "football_defaults": self._football_defaults,
-            "feature_flags": self._feature_flags,
-            "znc_config": self._znc_config,
-            "bluesky_config": self._bluesky_config,
-            "router_config": self._router_config,
-            "moderation_logs": self._moderation_logs[-1000:],  # Keep only last 1000
-            "user_warnings": self._user_warnings,
-        }
-        data = json.dumps(state, indent=2, sort_keys=True)
-        await asyncio.to_thread(self._path.write_text, data)
+            normalized_warnings: dict[int, dict[int, deque[dict]]] = {}
+            for guild_id, users in user_warnings.items():
+                if not isinstance(users, dict):
+                    continue
+                try:
+                    normalized_warnings[int(guild_id)] = {
+                        int(user_id): deque(
+                            warnings[-USER_WARNING_LIMIT:] if isinstance(warnings, list) else (),
+                            maxlen=USER_WARNING_LIMIT,
+                        )
+                        for user_id, warnings in users.items()
+                    }
+                except (ValueError, TypeError):
+                    continue
+            self._user_warnings = normalized_warnings
+
+        for name in migrate:
+            section_path = self._section_path(name)
+            if name in _JSONL_SECTIONS:
+                lines = self._monitor_history_lines()
+                data = self._join_lines(lines)
+                self._disk_lines[name] = len(lines)
+            else:
+                data = orjson.dumps(self._section_state(name), option=_DUMP_OPTIONS)
+            self._write_atomic(section_path, data)
+            self._file_digests[section_path] = self._digest(data)
+            if name in _JSONL_SECTIONS:
+                with suppress(OSError):
+                    self._section_path(name, self._path.suffix).unlink()
+
+    def _load_jsonl_section(self, name: str, path: Path) -> Any:
+        result = self._read_jsonl(path)
+        if result is None:
+            return None
+        records, intact = result
+        self._disk_lines[name] = len(records)
+        if not intact:
+            # Appending after a torn line would corrupt the next entry too
+            self._needs_rewrite.add(name)
+        # monitor_history lines are [url, sample] pairs
+        history: dict[str, list[Any]] = {}
+        for record in records:
+            if isinstance(record, list) and len(record) == 2:
+                history.setdefault(str(record[0]), []).append(record[1])
+        return history
+
+    async def _persist(self, *sections: str) -> None:
+        """Rewrite only the files holding ``sections`` (every file if none are given)."""
+        names = sections or (*_SHARED_SECTIONS, *_SEPARATE_SECTIONS)
+        files: dict[Path, Optional[str]] = {}
+        for name in names:
+            if name in _SEPARATE_SECTIONS:
+                files[self._section_path(name)] = name
+            else:
+                files[self._path] = None
+        await asyncio.gather(*(self._persist_file(path, name) for path, name in files.items()))
+
+    async def _persist_file(self, path: Path, section: Optional[str]) -> None:
+        # Serialize under the file lock so a newer snapshot is never overwritten by an older one
+        async with self._file_locks[path]:
+            if section in _JSONL_SECTIONS:
+                await self._persist_jsonl(path, section)
+                return
+            if section is None:
+                data = self._encode_shared_state()
+            else:
+                data = orjson.dumps(self._section_state(section), option=_DUMP_OPTIONS)
+            await asyncio.to_thread(self._write_atomic, path, data)
+            self._file_digests[path] = self._digest(data)
+
+    async def _persist_jsonl(self, path: Path, section: str) -> None:
+        appended = self._appended[section]
+        self._appended[section] = []
+        rewrite = (
+            section in self._needs_rewrite
+            or self._disk_lines[section] + len(appended) > self._monitor_history_compaction_threshold()
+        )
+        if not rewrite and not appended:
+            return
+        self._needs_rewrite.discard(section)
+        try:
+            if rewrite:
+                lines = self._monitor_history_lines()
+                data = self._join_lines(lines)
+                await asyncio.to_thread(self._write_atomic, path, data)
+                self._disk_lines[section] = len(lines)
+                self._file_digests[path] = self._digest(data)
+            else:
+                data = self._join_lines([orjson.dumps(record) for record in appended])
+                await asyncio.to_thread(self._append, path, data)
+                self._disk_lines[section] += len(appended)
+                self._file_digests.pop(path, None)
+        except BaseException:
+            # The dropped appends are only recoverable by rewriting from memory
+            self._needs_rewrite.add(section)
+            raise
 
     @staticmethod
-    def _normalize(items: Iterable[str]) -> list[str]:
-        normalized: list[str] = []
-        for item in items:
-            value = item.strip()
-            if value and value not in normalized:
-                normalized.append(value)
-        return normalized
+    def _set_or_pop(target: dict[str, Any], **updates: Any) -> None:
+        """Store each non-empty value; an empty value removes the key, None leaves it."""
+        for key, value in updates.items():
+            if value is None:
+                continue
+            if value:
+                target[key] = value
+            else:
+                target.pop(key, None)
+
+    def _mark_dirty(self, *sections: str) -> None:
+        self._dirty.update(sections)
+        for name in sections:
+            self._encoded_sections.pop(name, None)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self) -> None:
+        while self._dirty:
+            delay = PERSIST_DEBOUNCE_SECONDS * 2 ** min(self._persist_failures, 10)
+            await asyncio.sleep(min(delay, PERSIST_RETRY_MAX_SECONDS))
+            # Shielded so a flush() cancelling the sleep never interrupts a write
+            await asyncio.shield(self._persist_dirty())
+
+    async def _persist_dirty(self) -> None:
+        if not self._dirty:
+            return
+        sections = tuple(self._dirty)
+        self._dirty.clear()
+        try:
+            await self._persist(*sections)
+        except Exception as exc:
+            self._dirty.update(sections)
+            self._persist_failures += 1
+            error = repr(exc)
+            if error != self._last_persist_error:
+                self._last_persist_error = error
+                logger.exception("Failed to persist config sections: %s", ", ".join(sections))
+            else:
+                logger.debug("Still failing to persist config sections (attempt %d): %s", self._persist_failures, error)
+            return
+        if self._persist_failures:
+            logger.info("Config sections persisted again after %d failed attempts", self._persist_failures)
+            self._persist_failures = 0
+            self._last_persist_error = None
+
+    async def flush(self) -> None:
+        """Write any pending changes to disk immediately."""
+        task = self._writer_task
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await self._persist_dirty()
+        # Wait for writes the cancelled writer had already started
+        for path in sorted(self._file_locks):
+            async with self._file_locks[path]:
+                pass
 
     # ---------------------------------------------------------------------
     # Monitor URLs management
     # ---------------------------------------------------------------------
-    async def list_monitor_urls(self) -> list[str]:
-        async with self._lock:
-            return list(self._monitor_urls)
+    async def list_monitor_urls(self) -> tuple[str, ...]:
+        return tuple(self._monitor_urls)
 
     async def add_monitor_url(self, url: str) -> bool:
         from src.utils import validate_url
@@ -199,33 +548,33 @@ class ConfigStore:
         if not validate_url(url):
             return False
         
-        async with self._lock:
-            if url in self._monitor_urls:
-                return False
-            self._monitor_urls.append(url)
-            self._monitor_metadata.setdefault(url, {})
-            self._monitor_history.setdefault(url, [])
-            await self._persist()
-            return True
+        if url in self._monitor_urls:
+            return False
+        url = sys.intern(url)
+        self._monitor_urls[url] = None
+        self._monitor_metadata.setdefault(url, {})
+        self._monitor_history.setdefault(url, deque(maxlen=MONITOR_HISTORY_LIMIT))
+        # An empty history has no lines to write
+        self._mark_dirty("monitor_urls", "monitor_metadata")
+        return True
 
     async def remove_monitor_url(self, url: str) -> bool:
         url = url.strip()
-        async with self._lock:
-            if url not in self._monitor_urls:
-                return False
-            self._monitor_urls.remove(url)
-            self._monitor_metadata.pop(url, None)
-            self._monitor_history.pop(url, None)
-            await self._persist()
-            return True
+        if url not in self._monitor_urls:
+            return False
+        del self._monitor_urls[url]
+        self._monitor_metadata.pop(url, None)
+        if self._monitor_history.pop(url, None):
+            self._needs_rewrite.add("monitor_history")
+        self._mark_dirty("monitor_urls", "monitor_metadata", "monitor_history")
+        return True
 
     async def list_monitor_targets(self) -> list[dict[str, Any]]:
-        async with self._lock:
-            targets: list[dict[str, Any]] = []
-            for url in self._monitor_urls:
-                metadata = dict(self._monitor_metadata.get(url, {}))
-                targets.append({"url": url, **metadata})
-            return targets
+        targets: list[dict[str, Any]] = []
+        for url in self._monitor_urls:
+            metadata = dict(self._monitor_metadata.get(url, {}))
+            targets.append({"url": url, **metadata})
+        return targets
 
     async def update_monitor_metadata(
         self,
@@ -238,40 +587,38 @@ class ConfigStore:
         verify_tls: Optional[bool] = None,
     ) -> Optional[dict[str, Any]]:
         url = url.strip()
-        async with self._lock:
-            if url not in self._monitor_urls:
-                return None
-            metadata = self._monitor_metadata.setdefault(url, {})
-
-            if clear_keyword:
+        if url not in self._monitor_urls:
+            return None
+        metadata = self._monitor_metadata.setdefault(url, {})
+
+        if clear_keyword:
+            metadata.pop("keyword", None)
+        elif keyword is not None:
+            keyword = keyword.strip()
+            if keyword:
+                metadata["keyword"] = keyword
+            else:
                 metadata.pop("keyword", None)
-            elif keyword is not None:
-                keyword = keyword.strip()
-                if keyword:
-                    metadata["keyword"] = keyword
-                else:
-                    metadata.pop("keyword", None)
 
-            if clear_expected_status:
-                metadata.pop("expected_status", None)
-            elif expected_status is not None:
-                if expected_status < 100 or expected_status > 599:
-                    raise ValueError("expected_status must be between 100 and 599")
-                metadata["expected_status"] = expected_status
+        if clear_expected_status:
+            metadata.pop("expected_status", None)
+        elif expected_status is not None:
+            if expected_status < 100 or expected_status > 599:
+                raise ValueError("expected_status must be between 100 and 599")
+            metadata["expected_status"] = expected_status
 
-            if verify_tls is not None:
-                metadata["verify_tls"] = bool(verify_tls)
+        if verify_tls is not None:
+            metadata["verify_tls"] = bool(verify_tls)
 
-            # Remove empty metadata dictionaries to keep payload small
-            if not metadata:
-                self._monitor_metadata.pop(url, None)
+        # Remove empty metadata dictionaries to keep payload small
+        if not metadata:
+            self._monitor_metadata.pop(url, None)
 
-            await self._persist()
-            return dict(metadata)
+        self._mark_dirty("monitor_metadata")
+        return dict(metadata)
 
     async def get_monitor_metadata(self, url: str) -> dict[str, Any]:
-        async with self._lock:
-            return dict(self._monitor_metadata.get(url.strip(), {}))
+        return dict(self._monitor_metadata.get(url.strip(), {}))
 
     async def record_monitor_sample(
         self,
@@ -280,34 +627,31 @@ class ConfigStore:
         *,
         max_entries: int = 50,
     ) -> None:
-        url = url.strip()
+        # Called once per probe with URLs from list_monitor_targets, which are
+        # already canonical, so unlike the user-facing methods this skips strip().
         if not url:
             return
-        async with self._lock:
-            history = self._monitor_history.setdefault(url, [])
-            history.append(sample)
-            if len(history) > max_entries:
-                self._monitor_history[url] = history[-max_entries:]
-            await self._persist()
+        history = self._monitor_history.get(url)
+        if history is None or history.maxlen != max_entries:
+            history = deque(history or (), maxlen=max_entries)
+            self._monitor_history[sys.intern(url)] = history
+        history.append(sample)
+        self._appended["monitor_history"].append([url, sample])
+        self._mark_dirty("monitor_history")
 
     async def get_monitor_history(self, url: str, limit: int = 10) -> list[dict[str, Any]]:
-        if limit <= 0:
-            return []
-        async with self._lock:
-            history = self._monitor_history.get(url.strip(), [])
-            return list(history[-limit:])
+        history = self._monitor_history.get(url.strip())
+        return _tail(history, limit) if history else []
 
     async def get_monitor_snapshot(self, url: str) -> Optional[dict[str, Any]]:
-        async with self._lock:
-            history = self._monitor_history.get(url.strip(), [])
-            return history[-1] if history else None
+        history = self._monitor_history.get(url.strip(), [])
+        return history[-1] if history else None
 
     # ---------------------------------------------------------------------
     # RSS feeds management
     # ---------------------------------------------------------------------
-    async def list_rss_feeds(self) -> list[str]:
-        async with self._lock:
-            return list(self._rss_feeds)
+    async def list_rss_feeds(self) -> tuple[str, ...]:
+        return tuple(self._rss_feeds)
 
     async def add_rss_feed(self, url: str) -> bool:
         from src.utils import validate_url
@@ -320,62 +664,55 @@ class ConfigStore:
         if not validate_url(url):
             return False
         
-        async with self._lock:
-            if url in self._rss_feeds:
-                return False
-            self._rss_feeds.append(url)
-            await self._persist()
-            return True
+        if url in self._rss_feeds:
+            return False
+        self._rss_feeds[url] = None
+        self._mark_dirty("rss_feeds")
+        return True
 
     async def remove_rss_feed(self, url: str) -> bool:
         url = url.strip()
-        async with self._lock:
-            if url not in self._rss_feeds:
-                return False
-            self._rss_feeds.remove(url)
-            await self._persist()
-            return True
+        if url not in self._rss_feeds:
+            return False
+        del self._rss_feeds[url]
+        self._mark_dirty("rss_feeds")
+        return True
 
     # ---------------------------------------------------------------------
     # Reload management
     # ---------------------------------------------------------------------
     async def reload_from_disk(self) -> None:
-        async with self._lock:
-            self._load()
+        await self.flush()
+        self._load()
 
     # ---------------------------------------------------------------------
     # Gamble credits management
     # ---------------------------------------------------------------------
     async def get_credits(self, user_id: int) -> int:
-        async with self._lock:
-            return self._credits.get(str(user_id), 0)
+        return self._credits.get(user_id, 0)
 
     async def add_credits(self, user_id: int, amount: int) -> int:
         if amount == 0:
             return await self.get_credits(user_id)
-        async with self._lock:
-            key = str(user_id)
-            balance = self._credits.get(key, 0) + amount
-            if balance < 0:
-                balance = 0
-            self._credits[key] = balance
-            await self._persist()
-            return balance
+        balance = self._credits.get(user_id, 0) + amount
+        if balance < 0:
+            balance = 0
+        self._credits[user_id] = balance
+        self._mark_dirty("credits")
+        return balance
 
     async def set_credits(self, user_id: int, balance: int) -> int:
         if balance < 0:
             balance = 0
-        async with self._lock:
-            self._credits[str(user_id)] = balance
-            await self._persist()
-            return balance
+        self._credits[user_id] = balance
+        self._mark_dirty("credits")
+        return balance
 
     # ---------------------------------------------------------------------
     # Football defaults management
     # ---------------------------------------------------------------------
-    async def get_football_defaults(self) -> dict[str, str]:
-        async with self._lock:
-            return dict(self._football_defaults)
+    async def get_football_defaults(self) -> Mapping[str, str]:
+        return MappingProxyType(self._football_defaults)
 
     async def update_football_defaults(
         self,
@@ -385,60 +722,41 @@ class ConfigStore:
         opponent: str | None = None,
         webhook_summary_prefix: str | None = None,
     ) -> dict[str, str]:
-        async with self._lock:
-            if competition is not None:
-                if competition:
-                    self._football_defaults["competition"] = competition
-                else:
-                    self._football_defaults.pop("competition", None)
-            if team is not None:
-                if team:
-                    self._football_defaults["team"] = team
-                else:
-                    self._football_defaults.pop("team", None)
-            if opponent is not None:
-                if opponent:
-                    self._football_defaults["opponent"] = opponent
-                else:
-                    self._football_defaults.pop("opponent", None)
-            if webhook_summary_prefix is not None:
-                if webhook_summary_prefix:
-                    self._football_defaults["webhook_summary_prefix"] = webhook_summary_prefix
-                else:
-                    self._football_defaults.pop("webhook_summary_prefix", None)
-            await self._persist()
-            return dict(self._football_defaults)
+        self._set_or_pop(
+            self._football_defaults,
+            competition=competition,
+            team=team,
+            opponent=opponent,
+            webhook_summary_prefix=webhook_summary_prefix,
+        )
+        self._mark_dirty("football_defaults")
+        return dict(self._football_defaults)
 
     async def clear_football_defaults(self) -> None:
-        async with self._lock:
-            self._football_defaults.clear()
-            await self._persist()
+        self._football_defaults.clear()
+        self._mark_dirty("football_defaults")
 
     # ---------------------------------------------------------------------
     # Feature flags management
     # ---------------------------------------------------------------------
-    async def get_feature_flags(self) -> dict[str, bool]:
-        async with self._lock:
-            return dict(self._feature_flags)
+    async def get_feature_flags(self) -> Mapping[str, bool]:
+        return MappingProxyType(self._feature_flags)
 
     async def set_feature_flag(self, feature: str, enabled: bool) -> bool:
-        async with self._lock:
-            if feature not in self._feature_flags:
-                return False
-            self._feature_flags[feature] = enabled
-            await self._persist()
-            return True
+        if feature not in self._feature_flags:
+            return False
+        self._feature_flags[feature] = enabled
+        self._mark_dirty("feature_flags")
+        return True
 
     async def is_feature_enabled(self, feature: str) -> bool:
-        async with self._lock:
-            return self._feature_flags.get(feature, False)
+        return self._feature_flags.get(feature, False)
 
     # ---------------------------------------------------------------------
     # ZNC configuration management
     # ---------------------------------------------------------------------
-    async def get_znc_config(self) -> dict[str, str]:
-        async with self._lock:
-            return dict(self._znc_config)
+    async def get_znc_config(self) -> Mapping[str, str]:
+        return MappingProxyType(self._znc_config)
 
     async def update_znc_config(
         self,
@@ -447,36 +765,24 @@ class ConfigStore:
         admin_username: Optional[str] = None,
         admin_password: Optional[str] = None,
     ) -> dict[str, str]:
-        async with self._lock:
-            if base_url is not None:
-                if base_url:
-                    self._znc_config["base_url"] = base_url
-                else:
-                    self._znc_config.pop("base_url", None)
-            if admin_username is not None:
-                if admin_username:
-                    self._znc_config["admin_username"] = admin_username
-                else:
-                    self._znc_config.pop("admin_username", None)
-            if admin_password is not None:
-                if admin_password:
-                    self._znc_config["admin_password"] = admin_password
-                else:
-                    self._znc_config.pop("admin_password", None)
-            await self._persist()
-            return dict(self._znc_config)
+        self._set_or_pop(
+            self._znc_config,
+            base_url=base_url,
+            admin_username=admin_username,
+            admin_password=admin_password,
+        )
+        self._mark_dirty("znc_config")
+        return dict(self._znc_config)
 
     async def clear_znc_config(self) -> None:
-        async with self._lock:
-            self._znc_config.clear()
-            await self._persist()
+        self._znc_config.clear()
+        self._mark_dirty("znc_config")
 
     # ---------------------------------------------------------------------
     # Bluesky configuration management
     # ---------------------------------------------------------------------
-    async def get_bluesky_config(self) -> dict[str, str]:
-        async with self._lock:
-            return dict(self._bluesky_config)
+    async def get_bluesky_config(self) -> Mapping[str, str]:
+        return MappingProxyType(self._bluesky_config)
 
     async def update_bluesky_config(
         self,
@@ -484,31 +790,19 @@ class ConfigStore:
         handle: Optional[str] = None,
         app_password: Optional[str] = None,
     ) -> dict[str, str]:
-        async with self._lock:
-            if handle is not None:
-                if handle:
-                    self._bluesky_config["handle"] = handle
-                else:
-                    self._bluesky_config.pop("handle", None)
-            if app_password is not None:
-                if app_password:
-                    self._bluesky_config["app_password"] = app_password
-                else:
-                    self._bluesky_config.pop("app_password", None)
-            await self._persist()
-            return dict(self._bluesky_config)
+        self._set_or_pop(self._bluesky_config, handle=handle, app_password=app_password)
+        self._mark_dirty("bluesky_config")
+        return dict(self._bluesky_config)
 
     async def clear_bluesky_config(self) -> None:
-        async with self._lock:
-            self._bluesky_config.clear()
-            await self._persist()
+        self._bluesky_config.clear()
+        self._mark_dirty("bluesky_config")
 
     # ---------------------------------------------------------------------
     # Router configuration management
     # ---------------------------------------------------------------------
-    async def get_router_config(self) -> dict[str, str]:
-        async with self._lock:
-            return dict(self._router_config)
+    async def get_router_config(self) -> Mapping[str, str]:
+        return MappingProxyType(self._router_config)
 
     async def update_router_config(
         self,
@@ -517,97 +811,94 @@ class ConfigStore:
         snmp_community: Optional[str] = None,
         stats_interval_seconds: Optional[int] = None,
     ) -> dict[str, str]:
-        async with self._lock:
-            if snmp_host is not None:
-                if snmp_host:
-                    self._router_config["snmp_host"] = snmp_host
-                else:
-                    self._router_config.pop("snmp_host", None)
-            if snmp_community is not None:
-                if snmp_community:
-                    self._router_config["snmp_community"] = snmp_community
-                else:
-                    self._router_config.pop("snmp_community", None)
-            if stats_interval_seconds is not None:
-                if stats_interval_seconds > 0:
-                    self._router_config["stats_interval_seconds"] = str(stats_interval_seconds)
-                else:
-                    self._router_config.pop("stats_interval_seconds", None)
-            await self._persist()
-            return dict(self._router_config)
+        self._set_or_pop(self._router_config, snmp_host=snmp_host, snmp_community=snmp_community)
+        if stats_interval_seconds is not None:
+            if stats_interval_seconds > 0:
+                self._router_config["stats_interval_seconds"] = str(stats_interval_seconds)
+            else:
+                self._router_config.pop("stats_interval_seconds", None)
+        self._mark_dirty("router_config")
+        return dict(self._router_config)
 
     async def clear_router_config(self) -> None:
-        async with self._lock:
-            self._router_config.clear()
-            await self._persist()
+        self._router_config.clear()
+        self._mark_dirty("router_config")
+
+    # ---------------------------------------------------------------------
+    # Relay webhook management
+    # ---------------------------------------------------------------------
+    async def get_relay_webhook(self) -> Mapping[str, str]:
+        return MappingProxyType(self._relay_webhook)
+
+    async def set_relay_webhook(self, channel_id: int, webhook_id: int, token: str) -> None:
+        self._relay_webhook = {
+            "channel_id": str(channel_id),
+            "id": str(webhook_id),
+            "token": token,
+        }
+        self._mark_dirty("relay_webhook")
+
+    async def clear_relay_webhook(self) -> None:
+        if not self._relay_webhook:
+            return
+        self._relay_webhook = {}
+        self._mark_dirty("relay_webhook")
 
     # ---------------------------------------------------------------------
     # Moderation logs management
     # ---------------------------------------------------------------------
     async def add_moderation_log(self, log_entry: dict) -> None:
         """Add a moderation log entry."""
-        async with self._lock:
-            self._moderation_logs.append(log_entry)
-            # Keep only last 1000 entries
-            if len(self._moderation_logs) > 1000:
-                self._moderation_logs = self._moderation_logs[-1000:]
-            await self._persist()
+        # The deque drops the oldest entry once MODERATION_LOG_LIMIT is reached
+        self._moderation_logs.append(log_entry)
+        self._mark_dirty("moderation_logs")
 
     async def get_moderation_logs(self, limit: int = 100) -> list[dict]:
         """Get recent moderation logs."""
-        async with self._lock:
-            return list(self._moderation_logs[-limit:])
+        return _tail(self._moderation_logs, limit)
 
     # ---------------------------------------------------------------------
     # User warnings/strikes management
     # ---------------------------------------------------------------------
     async def add_warning(self, guild_id: int, user_id: int, reason: str, moderator_id: int) -> int:
-        """Add a warning to a user. Returns total warning count."""
-        async with self._lock:
-            guild_key = str(guild_id)
-            user_key = str(user_id)
-            
-            if guild_key not in self._user_warnings:
-                self._user_warnings[guild_key] = {}
-            if user_key not in self._user_warnings[guild_key]:
-                self._user_warnings[guild_key][user_key] = []
-            
-            warning = {
-                "timestamp": datetime.datetime.utcnow().isoformat(),
-                "reason": reason,
-                "moderator_id": str(moderator_id),
-            }
-            self._user_warnings[guild_key][user_key].append(warning)
-            await self._persist()
-            return len(self._user_warnings[guild_key][user_key])
+        """Add a warning to a user. Returns total warning count.
+
+        Only the newest USER_WARNING_LIMIT warnings are kept per user.
+        """
+        users = self._user_warnings.setdefault(guild_id, {})
+        warnings = users.get(user_id)
+        if warnings is None:
+            warnings = users[user_id] = deque(maxlen=USER_WARNING_LIMIT)
+        
+        warning = {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "reason": reason,
+            "moderator_id": str(moderator_id),
+        }
+        warnings.append(warning)
+        self._mark_dirty("user_warnings")
+        return len(warnings)
 
     async def get_warnings(self, guild_id: int, user_id: int) -> list[dict]:
         """Get all warnings for a user."""
-        async with self._lock:
-            guild_key = str(guild_id)
-            user_key = str(user_id)
-            return list(self._user_warnings.get(guild_key, {}).get(user_key, []))
+        users = self._user_warnings.get(guild_id)
+        warnings = users.get(user_id) if users else None
+        return list(warnings) if warnings else []
 
     async def clear_warnings(self, guild_id: int, user_id: int) -> bool:
         """Clear all warnings for a user. Returns True if warnings were cleared."""
-        async with self._lock:
-            guild_key = str(guild_id)
-            user_key = str(user_id)
-            if guild_key in self._user_warnings and user_key in self._user_warnings[guild_key]:
-                del self._user_warnings[guild_key][user_key]
-                await self._persist()
-                return True
+        users = self._user_warnings.get(guild_id)
+        if not users or users.pop(user_id, None) is None:
             return False
+        self._mark_dirty("user_warnings")
+        return True
 
     async def remove_warning(self, guild_id: int, user_id: int, index: int) -> bool:
         """Remove a specific warning by index. Returns True if removed."""
-        async with self._lock:
-            guild_key = str(guild_id)
-            user_key = str(user_id)
-            if guild_key in self._user_warnings and user_key in self._user_warnings[guild_key]:
-                warnings = self._user_warnings[guild_key][user_key]
-                if 0 <= index < len(warnings):
-                    warnings.pop(index)
-                    await self._persist()
-                    return True
+        users = self._user_warnings.get(guild_id)
+        warnings = users.get(user_id) if users else None
+        if warnings is None or not 0 <= index < len(warnings):
             return False
+        del warnings[index]
+        self._mark_dirty("user_warnings")
+        return True
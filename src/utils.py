@@ -54,6 +54,10 @@ def format_bytes(bytes_count: int) -> str:
     return f"{bytes_count:.2f} PB"
 
 
+# Characters that are invalid in filenames, each mapped to an underscore
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename by removing invalid characters.
     
@@ -64,7 +68,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename safe for filesystem
     """
     # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
     # Remove leading/trailing dots and spaces
     filename = filename.strip('. ')
     # Limit length
@@ -89,6 +93,11 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+# Match patterns like "5m", "2h", "3d", "1h 30m"
+_DURATION_PATTERN = re.compile(r'(\d+)\s*([smhd])')
+_DURATION_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
 def parse_duration(duration_str: str) -> Optional[timedelta]:
     """Parse a duration string to timedelta.
     
@@ -108,26 +117,12 @@ def parse_duration(duration_str: str) -> Optional[timedelta]:
     if not duration_str:
         return None
     
-    total_seconds = 0
-    
-    # Match patterns like "5m", "2h", "3d", "1h 30m"
-    pattern = r'(\d+)\s*([smhd])'
-    matches = re.findall(pattern, duration_str)
+    matches = _DURATION_PATTERN.findall(duration_str)
     
     if not matches:
         return None
     
-    for value, unit in matches:
-        value = int(value)
-        if unit == 's':
-            total_seconds += value
-        elif unit == 'm':
-            total_seconds += value * 60
-        elif unit == 'h':
-            total_seconds += value * 3600
-        elif unit == 'd':
-            total_seconds += value * 86400
-    
+    total_seconds = sum(int(value) * _DURATION_UNIT_SECONDS[unit] for value, unit in matches)
     return timedelta(seconds=total_seconds)
 
 
@@ -176,6 +171,15 @@ def safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL.
     
@@ -185,14 +189,14 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL, False otherwise
     """
-    pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    return pattern.match(url) is not None
+    # Cheap scheme check before running the regex
+    if not url[:8].lower().startswith(("http://", "https://")):
+        return False
+    return _URL_PATTERN.match(url) is not None
+
+
+# Discord markdown characters, each mapped to its backslash-escaped form
+_MARKDOWN_ESCAPES = str.maketrans({char: f'\\{char}' for char in '*_~`|>#'})
 
 
 def escape_markdown(text: str) -> str:
@@ -204,11 +208,7 @@ def escape_markdown(text: str) -> str:
     Returns:
         Escaped text
     """
-    # Escape Discord markdown characters
-    chars = ['*', '_', '~', '`', '|', '>', '#']
-    for char in chars:
-        text = text.replace(char, f'\\{char}')
-    return text
+    return text.translate(_MARKDOWN_ESCAPES)
 
 
 def chunk_text(text: str, max_length: int = 2000, separator: str = "\n") -> list[str]:
@@ -226,22 +226,26 @@ def chunk_text(text: str, max_length: int = 2000, separator: str = "\n") -> list
         return [text]
     
     chunks = []
-    lines = text.split(separator)
-    current_chunk = ""
-    
-    for line in lines:
-        if len(current_chunk) + len(line) + len(separator) <= max_length:
-            if current_chunk:
-                current_chunk += separator + line
-            else:
-                current_chunk = line
-        else:
-            if current_chunk:
-                chunks.append(current_chunk)
-            current_chunk = line
-    
-    if current_chunk:
-        chunks.append(current_chunk)
+    current_parts: list[str] = []
+    current_length = 0
+    
+    for line in text.split(separator):
+        added = len(line) + (len(separator) if current_parts else 0)
+        if current_length + added <= max_length:
+            current_parts.append(line)
+            current_length += added
+            continue
+        if current_parts:
+            chunks.append(separator.join(current_parts))
+        # Hard-split lines that would not fit in a chunk on their own
+        while len(line) > max_length:
+            chunks.append(line[:max_length])
+            line = line[max_length:]
+        current_parts = [line]
+        current_length = len(line)
+    
+    if current_parts:
+        chunks.append(separator.join(current_parts))
     
     return chunks
 
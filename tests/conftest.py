@@ -6,6 +6,8 @@ from pathlib import Path
 import tempfile
 import shutil
 
+from passlib.context import CryptContext
+
 from src.config import Settings, IRCNetworkConfig
 
 
@@ -25,9 +27,24 @@ def temp_data_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-@pytest.fixture
-def minimal_settings():
-    """Create minimal settings for testing."""
+@pytest.fixture(scope="session")
+def fast_pwd_context():
+    """bcrypt context at the minimum cost; its hashes are cheap to verify too."""
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+
+
+@pytest.fixture(scope="session")
+def dashboard_password_hash(fast_pwd_context):
+    """bcrypt hash of "hashed_password_123", computed once per session."""
+    return fast_pwd_context.hash("hashed_password_123")
+
+
+@pytest.fixture(scope="session")
+def base_settings():
+    """Canonical test settings, built once per session.
+
+    Settings is frozen; tests derive variants with dataclasses.replace().
+    """
     return Settings(
         discord_token="test_token",
         discord_channel_id=123,
@@ -76,5 +93,6 @@ def minimal_settings():
         router_snmp_community=None,
         router_stats_interval_seconds=3600,
         weather_api_key=None,
+        idlerpg_username=None,
+        idlerpg_password=None,
     )
-
@@ -0,0 +1,39 @@
+"""Lightweight stand-ins for runtime objects used across the tests."""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping
+
+from src.config import Settings
+
+
+@dataclass
+class StubCoordinator:
+    """The RelayCoordinator attributes read by the cogs and the API.
+
+    Cheaper than MagicMock(spec=RelayCoordinator), which introspects the
+    whole class, and stricter: anything not listed here raises AttributeError.
+    """
+
+    settings: Settings
+    config_store: Any
+    discord_bot: Any = None
+    irc_clients: list = field(default_factory=list)
+    get_health_stats: Callable[[], dict] = dict
+
+
+class StubConfigStore:
+    """In-memory stand-in for the ConfigStore calls made by the cog and API tests.
+
+    Unlike AsyncMock it records nothing and invents no attributes; tests
+    assert on the stored data instead of on recorded calls.
+    """
+
+    def __init__(self) -> None:
+        self.moderation_logs: list[dict] = []
+        self.feature_flags: dict[str, bool] = {}
+
+    async def add_moderation_log(self, log_entry: dict) -> None:
+        self.moderation_logs.append(log_entry)
+
+    async def get_feature_flags(self) -> Mapping[str, bool]:
+        return self.feature_flags
@@ -1,8 +1,10 @@
 """Tests for dashboard authentication and utilities."""
 
 import pytest
+from dataclasses import replace
 from datetime import timedelta
 
+from src import dashboard
 from src.dashboard import (
     get_password_hash,
     verify_password,
@@ -10,7 +12,12 @@ from src.dashboard import (
     verify_token,
     authenticate_user,
 )
-from src.config import Settings
+
+
+@pytest.fixture(autouse=True)
+def fast_hashing(monkeypatch, fast_pwd_context):
+    """Hash with minimum-cost bcrypt in every test; the $2b$ format is unchanged."""
+    monkeypatch.setattr(dashboard, "pwd_context", fast_pwd_context)
 
 
 def test_password_hashing():
@@ -49,52 +56,13 @@ def test_jwt_token():
     assert wrong_payload is None
 
 
-def test_authenticate_user_plain_text():
+def test_authenticate_user_plain_text(base_settings):
     """Test authentication with plain text password."""
-    settings = Settings(
-        discord_token="test",
-        discord_channel_id=123,
-        discord_guild_id=None,
-        discord_webhook_url=None,
-        telegram_bot_token=None,
-        telegram_chat_id=None,
-        welcome_channel_id=None,
-        welcome_message=None,
-        announcements_channel_id=None,
-        irc_server="test",
-        irc_port=6667,
-        irc_tls=False,
-        irc_channel="#test",
-        irc_nick="test",
-        moderation_log_channel_id=None,
-        moderation_muted_role_id=None,
-        moderation_min_account_age_days=None,
-        moderation_join_rate_limit_count=None,
-        moderation_join_rate_limit_seconds=None,
-        monitor_urls=[],
-        monitor_interval_seconds=300,
-        rss_feeds=[],
-        rss_poll_interval_seconds=600,
-        music_voice_channel_id=None,
-        music_text_channel_id=None,
-        football_webhook_secret=None,
-        football_default_competition=None,
-        football_default_team=None,
-        chocolate_notify_user_id=None,
-        api_host="0.0.0.0",
-        api_port=8000,
-        znc_base_url=None,
-        znc_admin_username=None,
-        znc_admin_password=None,
+    settings = replace(
+        base_settings,
         dashboard_username="admin",
         dashboard_password="plaintext123",
         dashboard_secret_key="test_secret",
-        bluesky_handle=None,
-        bluesky_app_password=None,
-        router_snmp_host=None,
-        router_snmp_community=None,
-        router_stats_interval_seconds=3600,
-        weather_api_key=None,
     )
     
     # Correct credentials
@@ -107,55 +75,15 @@ def test_authenticate_user_plain_text():
     assert authenticate_user("admin", "wrong_password", settings) is False
 
 
-def test_authenticate_user_hashed():
+def test_authenticate_user_hashed(base_settings, dashboard_password_hash):
     """Test authentication with hashed password."""
     password = "hashed_password_123"
-    hashed = get_password_hash(password)
     
-    settings = Settings(
-        discord_token="test",
-        discord_channel_id=123,
-        discord_guild_id=None,
-        discord_webhook_url=None,
-        telegram_bot_token=None,
-        telegram_chat_id=None,
-        welcome_channel_id=None,
-        welcome_message=None,
-        announcements_channel_id=None,
-        irc_server="test",
-        irc_port=6667,
-        irc_tls=False,
-        irc_channel="#test",
-        irc_nick="test",
-        moderation_log_channel_id=None,
-        moderation_muted_role_id=None,
-        moderation_min_account_age_days=None,
-        moderation_join_rate_limit_count=None,
-        moderation_join_rate_limit_seconds=None,
-        monitor_urls=[],
-        monitor_interval_seconds=300,
-        rss_feeds=[],
-        rss_poll_interval_seconds=600,
-        music_voice_channel_id=None,
-        music_text_channel_id=None,
-        football_webhook_secret=None,
-        football_default_competition=None,
-        football_default_team=None,
-        chocolate_notify_user_id=None,
-        api_host="0.0.0.0",
-        api_port=8000,
-        znc_base_url=None,
-        znc_admin_username=None,
-        znc_admin_password=None,
+    settings = replace(
+        base_settings,
         dashboard_username="admin",
-        dashboard_password=hashed,
+        dashboard_password=dashboard_password_hash,
         dashboard_secret_key="test_secret",
-        bluesky_handle=None,
-        bluesky_app_password=None,
-        router_snmp_host=None,
-        router_snmp_community=None,
-        router_stats_interval_seconds=3600,
-        weather_api_key=None,
     )
     
     # Correct credentials
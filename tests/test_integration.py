@@ -1,72 +1,38 @@
 """Integration tests for bot functionality."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import datetime
 
-import discord
-
-from src.relay import RelayCoordinator
-from src.config import Settings
 from src.storage import ConfigStore
+from tests.stubs import StubCoordinator
 
 
 @pytest.fixture
-def mock_settings():
+def mock_settings(base_settings):
     """Create mock settings."""
-    return Settings(
-        discord_token="test_token",
-        discord_channel_id=123,
-        discord_guild_id=None,
-        discord_webhook_url=None,
-        telegram_bot_token=None,
-        telegram_chat_id=None,
-        welcome_channel_id=None,
-        welcome_message=None,
-        announcements_channel_id=None,
-        irc_server="test.irc.server",
-        irc_port=6667,
-        irc_tls=False,
-        irc_channel="#test",
-        irc_nick="testbot",
+    return replace(
+        base_settings,
         moderation_log_channel_id=456,
         moderation_muted_role_id=789,
         moderation_min_account_age_days=7,
         moderation_join_rate_limit_count=5,
         moderation_join_rate_limit_seconds=60,
-        monitor_urls=[],
-        monitor_interval_seconds=300,
-        rss_feeds=[],
-        rss_poll_interval_seconds=600,
-        music_voice_channel_id=None,
-        music_text_channel_id=None,
-        football_webhook_secret=None,
-        football_default_competition=None,
-        football_default_team=None,
-        chocolate_notify_user_id=None,
-        api_host="0.0.0.0",
-        api_port=8000,
-        znc_base_url=None,
-        znc_admin_username=None,
-        znc_admin_password=None,
         dashboard_username="admin",
         dashboard_password="testpass",
-        dashboard_secret_key="test_secret_key",
-        bluesky_handle=None,
-        bluesky_app_password=None,
-        router_snmp_host=None,
-        router_snmp_community=None,
-        router_stats_interval_seconds=3600,
-        weather_api_key=None,
     )
 
 
+@pytest.fixture
+def config_store(mock_settings, tmp_path):
+    """Create a store backed by a per-test directory rather than data/."""
+    return ConfigStore(mock_settings, path=tmp_path / "config_state.json")
+
+
 @pytest.mark.asyncio
-async def test_warning_system_integration(mock_settings):
+async def test_warning_system_integration(mock_settings, config_store):
     """Test warning system integration with storage."""
-    coordinator = MagicMock(spec=RelayCoordinator)
-    coordinator.settings = mock_settings
-    coordinator.config_store = ConfigStore(mock_settings)
+    coordinator = StubCoordinator(settings=mock_settings, config_store=config_store)
     
     guild_id = 123
     user_id = 456
@@ -95,11 +61,9 @@ async def test_warning_system_integration(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_moderation_log_storage(mock_settings):
+async def test_moderation_log_storage(mock_settings, config_store):
     """Test moderation log storage and retrieval."""
-    coordinator = MagicMock(spec=RelayCoordinator)
-    coordinator.settings = mock_settings
-    coordinator.config_store = ConfigStore(mock_settings)
+    coordinator = StubCoordinator(settings=mock_settings, config_store=config_store)
     
     # Add log entries
     log1 = {
@@ -121,16 +85,14 @@ async def test_moderation_log_storage(mock_settings):
     # Retrieve logs
     logs = await coordinator.config_store.get_moderation_logs(limit=10)
     assert len(logs) >= 2
-    assert logs[-1]["message"] == "Test log entry 1"
-    assert logs[-2]["message"] == "Test log entry 2"
+    assert logs[-2]["message"] == "Test log entry 1"
+    assert logs[-1]["message"] == "Test log entry 2"  # Most recent last
 
 
 @pytest.mark.asyncio
-async def test_feature_flags_storage(mock_settings):
+async def test_feature_flags_storage(mock_settings, config_store):
     """Test feature flag storage and retrieval."""
-    coordinator = MagicMock(spec=RelayCoordinator)
-    coordinator.settings = mock_settings
-    coordinator.config_store = ConfigStore(mock_settings)
+    coordinator = StubCoordinator(settings=mock_settings, config_store=config_store)
     
     # Set feature flags
     await coordinator.config_store.set_feature_flag("games", False)
@@ -143,11 +105,9 @@ async def test_feature_flags_storage(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_monitor_urls_management(mock_settings):
+async def test_monitor_urls_management(mock_settings, config_store):
     """Test monitor URL management."""
-    coordinator = MagicMock(spec=RelayCoordinator)
-    coordinator.settings = mock_settings
-    coordinator.config_store = ConfigStore(mock_settings)
+    coordinator = StubCoordinator(settings=mock_settings, config_store=config_store)
     
     # Add URLs
     added1 = await coordinator.config_store.add_monitor_url("https://example.com")
@@ -172,11 +132,9 @@ async def test_monitor_urls_management(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_rss_feeds_management(mock_settings):
+async def test_rss_feeds_management(mock_settings, config_store):
     """Test RSS feed management."""
-    coordinator = MagicMock(spec=RelayCoordinator)
-    coordinator.settings = mock_settings
-    coordinator.config_store = ConfigStore(mock_settings)
+    coordinator = StubCoordinator(settings=mock_settings, config_store=config_store)
     
     # Add feeds
     added1 = await coordinator.config_store.add_rss_feed("https://example.com/feed.xml")
@@ -0,0 +1,123 @@
+"""Tests for the relay queues between IRC and Discord."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from src import relay
+from src.relay import DISCORD_MESSAGE_LIMIT, RELAY_QUEUE_MAXSIZE, RelayCoordinator
+
+
+@pytest_asyncio.fixture
+async def coordinator(base_settings, tmp_path, monkeypatch):
+    """Coordinator whose Discord deliveries are recorded instead of sent."""
+    # ConfigStore defaults to data/config_state.json relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(relay, "IRC_COALESCE_WINDOW_SECONDS", 0)
+    coordinator = RelayCoordinator(base_settings)
+    coordinator.delivered = []
+
+    async def deliver_message(author, content, network_suffix):
+        coordinator.delivered.append((author, content))
+
+    async def deliver_quit(author, reason):
+        coordinator.delivered.append(("quit", author))
+
+    coordinator._deliver_irc_message = deliver_message
+    coordinator._deliver_irc_quit = deliver_quit
+    return coordinator
+
+
+async def drain(coordinator):
+    """Run the Discord drain worker until everything queued so far is delivered."""
+    worker = asyncio.create_task(coordinator._drain_to_discord())
+    try:
+        await asyncio.wait_for(coordinator._to_discord_queue.join(), timeout=1.0)
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+    return coordinator.delivered
+
+
+@pytest.mark.asyncio
+async def test_consecutive_lines_from_one_author_are_merged(coordinator):
+    """Lines an author sends back to back go out as one Discord message."""
+    for line in ("one", "two", "three"):
+        await coordinator.handle_irc_message("alice", line)
+
+    assert await drain(coordinator) == [("alice", "one\ntwo\nthree")]
+
+
+@pytest.mark.asyncio
+async def test_author_change_splits_messages(coordinator):
+    """A different author ends the current message."""
+    await coordinator.handle_irc_message("alice", "one")
+    await coordinator.handle_irc_message("bob", "two")
+    await coordinator.handle_irc_message("alice", "three")
+
+    assert await drain(coordinator) == [("alice", "one"), ("bob", "two"), ("alice", "three")]
+
+
+@pytest.mark.asyncio
+async def test_merged_message_stays_under_discord_limit(coordinator):
+    """A line that would push the merged message past the limit starts a new one."""
+    first = "x" * (DISCORD_MESSAGE_LIMIT - 10)
+    await coordinator.handle_irc_message("alice", first)
+    await coordinator.handle_irc_message("alice", "y" * 10)
+
+    assert await drain(coordinator) == [("alice", first), ("alice", "y" * 10)]
+
+
+@pytest.mark.asyncio
+async def test_quit_notices_are_not_merged(coordinator):
+    """Quit notices are delivered in order and end the current message."""
+    await coordinator.handle_irc_message("alice", "one")
+    await coordinator.handle_irc_quit("alice", "bye")
+    await coordinator.handle_irc_message("alice", "two")
+
+    assert await drain(coordinator) == [("alice", "one"), ("quit", "alice"), ("alice", "two")]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_counts_messages(coordinator):
+    """Messages beyond the queue bound are dropped and counted."""
+    for n in range(RELAY_QUEUE_MAXSIZE + 2):
+        await coordinator.handle_irc_message("alice", str(n))
+
+    assert coordinator._to_discord_queue.qsize() == RELAY_QUEUE_MAXSIZE
+    assert coordinator.get_health_stats()["dropped_message_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_relay_queues_gives_up_after_timeout(coordinator):
+    """Without a running worker, flushing waits for the timeout and then returns."""
+    await coordinator.handle_irc_message("alice", "stuck")
+
+    await coordinator._flush_relay_queues(timeout=0.01)
+
+    assert coordinator._to_discord_queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_irc_sender_delivers_queued_lines_in_order(coordinator, monkeypatch):
+    """Each network's sender drains its queue to that network's channel."""
+    monkeypatch.setattr(relay, "IRC_SEND_INTERVAL_SECONDS", 0)
+    sent = []
+    client = coordinator.irc_clients[0]
+    monkeypatch.setattr(type(client), "connected", property(lambda self: True))
+
+    async def message(target, text):
+        sent.append((target, text))
+
+    monkeypatch.setattr(client, "message", message)
+    await coordinator.send_to_irc("<alice> one")
+    await coordinator.send_to_irc("<alice> two")
+
+    sender = asyncio.create_task(coordinator._irc_sender(0))
+    try:
+        await asyncio.wait_for(coordinator._irc_queues[0].join(), timeout=1.0)
+    finally:
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+    assert sent == [("#test", "<alice> one"), ("#test", "<alice> two")]
@@ -1,84 +1,24 @@
 """Tests for storage and configuration management."""
 
 import pytest
-import asyncio
-from pathlib import Path
 import json
-import tempfile
+import logging
+from collections.abc import Mapping
 
 from src.storage import ConfigStore
-from src.config import Settings, IRCNetworkConfig
 
 
 @pytest.fixture
-def temp_config_file():
+def temp_config_file(tmp_path):
     """Create a temporary config file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-        temp_path = Path(f.name)
-    yield temp_path
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
-
-
-@pytest.fixture
-def test_settings():
-    """Create test settings."""
-    return Settings(
-        discord_token="test",
-        discord_channel_id=123,
-        discord_guild_id=None,
-        discord_webhook_url=None,
-        telegram_bot_token=None,
-        telegram_chat_id=None,
-        welcome_channel_id=None,
-        welcome_message=None,
-        announcements_channel_id=None,
-        irc_networks=[
-            IRCNetworkConfig(
-                server="irc.test",
-                port=6667,
-                tls=False,
-                channel="#test",
-                nick="testbot",
-            )
-        ],
-        moderation_log_channel_id=None,
-        moderation_muted_role_id=None,
-        moderation_min_account_age_days=None,
-        moderation_join_rate_limit_count=None,
-        moderation_join_rate_limit_seconds=None,
-        monitor_urls=[],
-        monitor_interval_seconds=300,
-        rss_feeds=[],
-        rss_poll_interval_seconds=600,
-        music_voice_channel_id=None,
-        music_text_channel_id=None,
-        football_webhook_secret=None,
-        football_default_competition=None,
-        football_default_team=None,
-        chocolate_notify_user_id=None,
-        api_host="0.0.0.0",
-        api_port=8000,
-        znc_base_url=None,
-        znc_admin_username=None,
-        znc_admin_password=None,
-        dashboard_username=None,
-        dashboard_password=None,
-        dashboard_secret_key="test",
-        bluesky_handle=None,
-        bluesky_app_password=None,
-        router_snmp_host=None,
-        router_snmp_community=None,
-        router_stats_interval_seconds=3600,
-        weather_api_key=None,
-    )
+    # A per-test directory, so the per-section files are isolated too
+    return tmp_path / "config_state.json"
 
 
 @pytest.mark.asyncio
-async def test_monitor_urls(temp_config_file, test_settings):
+async def test_monitor_urls(temp_config_file, base_settings):
     """Test monitor URL management."""
-    store = ConfigStore(test_settings, path=temp_config_file)
+    store = ConfigStore(base_settings, path=temp_config_file)
     
     # Add URLs
     assert await store.add_monitor_url("https://example.com") is True
@@ -103,9 +43,9 @@ async def test_monitor_urls(temp_config_file, test_settings):
 
 
 @pytest.mark.asyncio
-async def test_monitor_metadata_and_history(temp_config_file, test_settings):
+async def test_monitor_metadata_and_history(temp_config_file, base_settings):
     """Ensure monitor metadata and history are persisted."""
-    store = ConfigStore(test_settings, path=temp_config_file)
+    store = ConfigStore(base_settings, path=temp_config_file)
 
     url = "https://history.test"
     assert await store.add_monitor_url(url) is True
@@ -135,9 +75,9 @@ async def test_monitor_metadata_and_history(temp_config_file, test_settings):
 
 
 @pytest.mark.asyncio
-async def test_rss_feeds(temp_config_file, test_settings):
+async def test_rss_feeds(temp_config_file, base_settings):
     """Test RSS feed management."""
-    store = ConfigStore(test_settings, path=temp_config_file)
+    store = ConfigStore(base_settings, path=temp_config_file)
     
     # Add feeds
     assert await store.add_rss_feed("https://example.com/feed.xml") is True
@@ -155,13 +95,13 @@ async def test_rss_feeds(temp_config_file, test_settings):
 
 
 @pytest.mark.asyncio
-async def test_feature_flags(temp_config_file, test_settings):
+async def test_feature_flags(temp_config_file, base_settings):
     """Test feature flag management."""
-    store = ConfigStore(test_settings, path=temp_config_file)
+    store = ConfigStore(base_settings, path=temp_config_file)
     
     # Get all flags
     flags = await store.get_feature_flags()
-    assert isinstance(flags, dict)
+    assert isinstance(flags, Mapping)
     assert "games" in flags
     
     # Check if feature is enabled
@@ -176,9 +116,9 @@ async def test_feature_flags(temp_config_file, test_settings):
 
 
 @pytest.mark.asyncio
-async def test_moderation_logs(temp_config_file, test_settings):
+async def test_moderation_logs(temp_config_file, base_settings):
     """Test moderation log storage."""
-    store = ConfigStore(test_settings, path=temp_config_file)
+    store = ConfigStore(base_settings, path=temp_config_file)
     
     # Add log entries
     log1 = {"timestamp": "2024-01-01T00:00:00", "message": "Test log 1"}
@@ -196,3 +136,165 @@ async def test_moderation_logs(temp_config_file, test_settings):
     logs = await store.get_moderation_logs(limit=1)
     assert len(logs) == 1
 
+
+@pytest.mark.asyncio
+async def test_sections_persist_to_separate_files(temp_config_file, base_settings):
+    """Large sections are written next to the main state file."""
+    store = ConfigStore(base_settings, path=temp_config_file)
+
+    await store.add_credits(1, 5)
+    await store.record_monitor_sample("https://a.test", {"n": 0})
+    await store.flush()
+
+    main_state = json.loads(temp_config_file.read_text())
+    assert main_state["credits"] == {"1": 5}
+    assert "monitor_history" not in main_state
+
+    history_path = temp_config_file.with_name("config_state.monitor_history.jsonl")
+    assert history_path.read_text().splitlines() == ['["https://a.test",{"n":0}]']
+
+    reloaded = ConfigStore(base_settings, path=temp_config_file)
+    assert await reloaded.get_credits(1) == 5
+    assert await reloaded.get_monitor_history("https://a.test") == [{"n": 0}]
+
+
+@pytest.mark.asyncio
+async def test_user_warnings_persist_to_separate_file(temp_config_file, base_settings):
+    """Warnings get their own file and reload with integer guild and user IDs."""
+    store = ConfigStore(base_settings, path=temp_config_file)
+
+    await store.add_credits(1, 5)
+    await store.add_warning(123, 456, "Spam", 789)
+    await store.flush()
+
+    assert "user_warnings" not in json.loads(temp_config_file.read_text())
+    assert temp_config_file.with_name("config_state.user_warnings.json").exists()
+
+    reloaded = ConfigStore(base_settings, path=temp_config_file)
+    warnings = await reloaded.get_warnings(123, 456)
+    assert len(warnings) == 1
+    assert warnings[0]["reason"] == "Spam"
+
+
+@pytest.mark.asyncio
+async def test_moderation_logs_stay_in_main_file(temp_config_file, base_settings):
+    """The Ruby bot reads and writes moderation_logs in the main state file."""
+    temp_config_file.write_text(json.dumps({"moderation_logs": [{"message": "from ruby"}]}))
+
+    store = ConfigStore(base_settings, path=temp_config_file)
+    await store.add_moderation_log({"message": "from python"})
+    await store.flush()
+
+    main_state = json.loads(temp_config_file.read_text())
+    assert main_state["moderation_logs"] == [{"message": "from ruby"}, {"message": "from python"}]
+
+
+@pytest.mark.asyncio
+async def test_legacy_inline_sections_are_migrated(temp_config_file, base_settings):
+    """Sections stored inline by older versions move to their own files."""
+    temp_config_file.write_text(json.dumps({"monitor_history": {"https://a.test": [{"n": 0}]}}))
+
+    store = ConfigStore(base_settings, path=temp_config_file)
+    await store.add_credits(1, 1)
+    await store.flush()
+
+    assert "monitor_history" not in json.loads(temp_config_file.read_text())
+    reloaded = ConfigStore(base_settings, path=temp_config_file)
+    assert await reloaded.get_monitor_history("https://a.test") == [{"n": 0}]
+
+
+@pytest.mark.asyncio
+async def test_writes_are_debounced(temp_config_file, base_settings):
+    """Bursts of mutations are written once, after the debounce window."""
+    store = ConfigStore(base_settings, path=temp_config_file)
+
+    for n in range(10):
+        await store.record_monitor_sample("https://a.test", {"n": n})
+    history_path = temp_config_file.with_name("config_state.monitor_history.jsonl")
+    assert not history_path.exists()
+
+    await store.flush()
+    assert len(history_path.read_text().splitlines()) == 10
+
+
+@pytest.mark.asyncio
+async def test_failing_writes_are_logged_once(temp_config_file, base_settings, monkeypatch, caplog):
+    """A write that keeps failing logs one traceback, then one line on recovery."""
+    store = ConfigStore(base_settings, path=temp_config_file)
+    write_atomic = ConfigStore._write_atomic
+
+    def disk_full(path, data):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(ConfigStore, "_write_atomic", staticmethod(disk_full))
+    await store.add_credits(1, 5)
+    for _ in range(3):
+        await store.flush()
+    assert len([record for record in caplog.records if record.exc_info]) == 1
+
+    monkeypatch.setattr(ConfigStore, "_write_atomic", staticmethod(write_atomic))
+    with caplog.at_level(logging.INFO, logger="src.storage"):
+        await store.flush()
+    assert "persisted again after 3 failed attempts" in caplog.text
+    assert json.loads(temp_config_file.read_text())["credits"] == {"1": 5}
+
+
+@pytest.mark.asyncio
+async def test_reload_from_disk_applies_external_changes(temp_config_file, base_settings):
+    """Only files changed on disk since the last read or write are reapplied."""
+    store = ConfigStore(base_settings, path=temp_config_file)
+    await store.add_credits(1, 5)
+    await store.record_monitor_sample("https://a.test", {"message": "kept"})
+    await store.flush()
+
+    state = json.loads(temp_config_file.read_text())
+    state["credits"]["1"] = 42
+    temp_config_file.write_text(json.dumps(state))
+
+    await store.reload_from_disk()
+    assert await store.get_credits(1) == 42
+    assert await store.get_monitor_history("https://a.test") == [{"message": "kept"}]
+
+
+@pytest.mark.asyncio
+async def test_monitor_history_is_appended_then_compacted(temp_config_file, base_settings):
+    """Samples are appended as lines; the file is compacted past twice what is kept."""
+    store = ConfigStore(base_settings, path=temp_config_file)
+    history_path = temp_config_file.with_name("config_state.monitor_history.jsonl")
+    url = "https://a.test"
+
+    await store.record_monitor_sample(url, {"n": 0}, max_entries=100)
+    await store.flush()
+    await store.record_monitor_sample(url, {"n": 1}, max_entries=100)
+    await store.flush()
+    assert history_path.read_text().splitlines() == [
+        '["https://a.test",{"n":0}]',
+        '["https://a.test",{"n":1}]',
+    ]
+
+    for n in range(2, 201):
+        await store.record_monitor_sample(url, {"n": n}, max_entries=100)
+    await store.flush()
+    assert len(history_path.read_text().splitlines()) == 100
+
+    reloaded = ConfigStore(base_settings, path=temp_config_file)
+    history = await reloaded.get_monitor_history(url, limit=100)
+    assert history[0] == {"n": 101}
+    assert history[-1] == {"n": 200}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_sections_keep_their_encoding(temp_config_file, base_settings):
+    """Only changed sections are re-encoded; the main file stays valid JSON."""
+    store = ConfigStore(base_settings, path=temp_config_file)
+    await store.add_credits(1, 5)
+    await store.set_feature_flag("games", False)
+    await store.flush()
+
+    await store.add_credits(2, 3)
+    await store.flush()
+
+    main_state = json.loads(temp_config_file.read_text())
+    assert main_state["credits"] == {"1": 5, "2": 3}
+    assert main_state["feature_flags"]["games"] is False
+    assert list(main_state) == sorted(main_state)
@@ -18,22 +18,28 @@ from src.utils import (
 )
 
 
-def test_format_uptime():
+@pytest.mark.parametrize("seconds,expected", [
+    (0, "0s"),
+    (30, "30s"),
+    (90, "1m 30s"),
+    (3661, "1h 1m"),
+    (90061, "1d 1h 1m"),
+    (-10, "0s"),
+])
+def test_format_uptime(seconds, expected):
     """Test uptime formatting."""
-    assert format_uptime(0) == "0s"
-    assert format_uptime(30) == "30s"
-    assert format_uptime(90) == "1m"
-    assert format_uptime(3661) == "1h 1m"
-    assert format_uptime(90061) == "1d 1h 1m"
-    assert format_uptime(-10) == "0s"
+    assert format_uptime(seconds) == expected
 
 
-def test_format_bytes():
+@pytest.mark.parametrize("bytes_count,expected", [
+    (0, "0.00 B"),
+    (1024, "1.00 KB"),
+    (1048576, "1.00 MB"),
+    (1073741824, "1.00 GB"),
+])
+def test_format_bytes(bytes_count, expected):
     """Test bytes formatting."""
-    assert format_bytes(0) == "0.00 B"
-    assert format_bytes(1024) == "1.00 KB"
-    assert format_bytes(1048576) == "1.00 MB"
-    assert format_bytes(1073741824) == "1.00 GB"
+    assert format_bytes(bytes_count) == expected
 
 
 def test_sanitize_filename():
@@ -53,55 +59,78 @@ def test_truncate_text():
     assert truncate_text("test", max_length=10) == "test"
 
 
-def test_parse_duration():
+@pytest.mark.parametrize("duration_str,expected", [
+    ("5m", timedelta(minutes=5)),
+    ("2h", timedelta(hours=2)),
+    ("3d", timedelta(days=3)),
+    ("1h 30m", timedelta(hours=1, minutes=30)),
+    ("1d2h 3m 4s", timedelta(days=1, hours=2, minutes=3, seconds=4)),
+])
+def test_parse_duration(duration_str, expected):
     """Test duration parsing."""
-    assert parse_duration("5m") == timedelta(minutes=5)
-    assert parse_duration("2h") == timedelta(hours=2)
-    assert parse_duration("3d") == timedelta(days=3)
-    assert parse_duration("1h 30m") == timedelta(hours=1, minutes=30)
-    assert parse_duration("") is None
-    assert parse_duration("invalid") is None
+    assert parse_duration(duration_str) == expected
 
 
-def test_format_duration():
+@pytest.mark.parametrize("duration_str", ["", "invalid"])
+def test_parse_duration_invalid(duration_str):
+    """Test that unparseable durations are rejected."""
+    assert parse_duration(duration_str) is None
+
+
+@pytest.mark.parametrize("delta,expected", [
+    (timedelta(minutes=5), "5m"),
+    (timedelta(hours=2), "2h"),
+    (timedelta(days=1, hours=2, minutes=30), "1d 2h 30m"),
+])
+def test_format_duration(delta, expected):
     """Test duration formatting."""
-    assert format_duration(timedelta(minutes=5)) == "5m"
-    assert format_duration(timedelta(hours=2)) == "2h"
-    assert format_duration(timedelta(days=1, hours=2, minutes=30)) == "1d 2h 30m"
+    assert format_duration(delta) == expected
 
 
-def test_safe_int():
+@pytest.mark.parametrize("value,default,expected", [
+    ("123", 0, 123),
+    (123, 0, 123),
+    ("invalid", 42, 42),
+    (None, 0, 0),
+])
+def test_safe_int(value, default, expected):
     """Test safe integer conversion."""
-    assert safe_int("123") == 123
-    assert safe_int(123) == 123
-    assert safe_int("invalid", default=42) == 42
-    assert safe_int(None, default=0) == 0
+    assert safe_int(value, default=default) == expected
 
 
-def test_safe_float():
+@pytest.mark.parametrize("value,default,expected", [
+    ("123.45", 0.0, 123.45),
+    (123.45, 0.0, 123.45),
+    ("invalid", 42.0, 42.0),
+    (None, 0.0, 0.0),
+])
+def test_safe_float(value, default, expected):
     """Test safe float conversion."""
-    assert safe_float("123.45") == 123.45
-    assert safe_float(123.45) == 123.45
-    assert safe_float("invalid", default=42.0) == 42.0
-    assert safe_float(None, default=0.0) == 0.0
-
-
-def test_validate_url():
+    assert safe_float(value, default=default) == expected
+
+
+@pytest.mark.parametrize("url,expected", [
+    ("http://example.com", True),
+    ("https://example.com", True),
+    ("http://localhost:8000", True),
+    ("not a url", False),
+    ("ftp://example.com", False),
+    ("example.com", False),
+])
+def test_validate_url(url, expected):
     """Test URL validation."""
-    assert validate_url("http://example.com") is True
-    assert validate_url("https://example.com") is True
-    assert validate_url("http://localhost:8000") is True
-    assert validate_url("not a url") is False
-    assert validate_url("ftp://example.com") is False
-    assert validate_url("example.com") is False
+    assert validate_url(url) is expected
 
 
-def test_escape_markdown():
+@pytest.mark.parametrize("text,expected", [
+    ("test", "test"),
+    ("**bold**", "\\*\\*bold\\*\\*"),
+    ("_italic_", "\\_italic\\_"),
+    ("`code`", "\\`code\\`"),
+], ids=["plain", "bold", "italic", "code"])
+def test_escape_markdown(text, expected):
     """Test markdown escaping."""
-    assert escape_markdown("test") == "test"
-    assert escape_markdown("**bold**") == "\\*\\*bold\\*\\*"
-    assert escape_markdown("_italic_") == "\\_italic\\_"
-    assert escape_markdown("`code`") == "\\`code\\`"
+    assert escape_markdown(text) == expected
 
 
 def test_chunk_text():
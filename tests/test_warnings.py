@@ -1,68 +1,19 @@
 """Tests for warning/strike tracking system."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from datetime import datetime
 
 from src.storage import ConfigStore
-from src.config import Settings
 
 
 @pytest.fixture
-def mock_settings():
-    """Create mock settings."""
-    return Settings(
-        discord_token="test",
-        discord_channel_id=123,
-        discord_guild_id=None,
-        discord_webhook_url=None,
-        telegram_bot_token=None,
-        telegram_chat_id=None,
-        welcome_channel_id=None,
-        welcome_message=None,
-        announcements_channel_id=None,
-        irc_server="test",
-        irc_port=6667,
-        irc_tls=False,
-        irc_channel="#test",
-        irc_nick="test",
-        moderation_log_channel_id=None,
-        moderation_muted_role_id=None,
-        moderation_min_account_age_days=None,
-        moderation_join_rate_limit_count=None,
-        moderation_join_rate_limit_seconds=None,
-        monitor_urls=[],
-        monitor_interval_seconds=300,
-        rss_feeds=[],
-        rss_poll_interval_seconds=600,
-        music_voice_channel_id=None,
-        music_text_channel_id=None,
-        football_webhook_secret=None,
-        football_default_competition=None,
-        football_default_team=None,
-        chocolate_notify_user_id=None,
-        api_host="0.0.0.0",
-        api_port=8000,
-        znc_base_url=None,
-        znc_admin_username=None,
-        znc_admin_password=None,
-        dashboard_username=None,
-        dashboard_password=None,
-        dashboard_secret_key="test",
-        bluesky_handle=None,
-        bluesky_app_password=None,
-        router_snmp_host=None,
-        router_snmp_community=None,
-        router_stats_interval_seconds=3600,
-        weather_api_key=None,
-    )
+def store(base_settings, tmp_path):
+    """Create an empty store backed by a per-test directory rather than data/."""
+    return ConfigStore(base_settings, path=tmp_path / "config_state.json")
 
 
 @pytest.mark.asyncio
-async def test_add_warning(mock_settings):
+async def test_add_warning(store):
     """Test adding a warning."""
-    store = ConfigStore(mock_settings)
-    
     count = await store.add_warning(123, 456, "Test warning", 789)
     assert count == 1
     
@@ -74,10 +25,8 @@ async def test_add_warning(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_multiple_warnings(mock_settings):
+async def test_multiple_warnings(store):
     """Test adding multiple warnings."""
-    store = ConfigStore(mock_settings)
-    
     count1 = await store.add_warning(123, 456, "First warning", 789)
     assert count1 == 1
     
@@ -92,19 +41,15 @@ async def test_multiple_warnings(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_get_warnings_empty(mock_settings):
+async def test_get_warnings_empty(store):
     """Test getting warnings for user with no warnings."""
-    store = ConfigStore(mock_settings)
-    
     warnings = await store.get_warnings(123, 456)
     assert len(warnings) == 0
 
 
 @pytest.mark.asyncio
-async def test_clear_warnings(mock_settings):
+async def test_clear_warnings(store):
     """Test clearing all warnings."""
-    store = ConfigStore(mock_settings)
-    
     # Add warnings
     await store.add_warning(123, 456, "Warning 1", 789)
     await store.add_warning(123, 456, "Warning 2", 789)
@@ -119,19 +64,15 @@ async def test_clear_warnings(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_clear_warnings_nonexistent(mock_settings):
+async def test_clear_warnings_nonexistent(store):
     """Test clearing warnings for user with no warnings."""
-    store = ConfigStore(mock_settings)
-    
     cleared = await store.clear_warnings(123, 456)
     assert cleared is False
 
 
 @pytest.mark.asyncio
-async def test_remove_warning_by_index(mock_settings):
+async def test_remove_warning_by_index(store):
     """Test removing a specific warning by index."""
-    store = ConfigStore(mock_settings)
-    
     # Add warnings
     await store.add_warning(123, 456, "Warning 1", 789)
     await store.add_warning(123, 456, "Warning 2", 789)
@@ -149,10 +90,8 @@ async def test_remove_warning_by_index(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_remove_warning_invalid_index(mock_settings):
+async def test_remove_warning_invalid_index(store):
     """Test removing warning with invalid index."""
-    store = ConfigStore(mock_settings)
-    
     await store.add_warning(123, 456, "Warning 1", 789)
     
     # Try invalid index
@@ -165,10 +104,8 @@ async def test_remove_warning_invalid_index(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_warnings_per_guild(mock_settings):
+async def test_warnings_per_guild(store):
     """Test that warnings are isolated per guild."""
-    store = ConfigStore(mock_settings)
-    
     # Add warnings to different guilds
     await store.add_warning(123, 456, "Guild 1 warning", 789)
     await store.add_warning(999, 456, "Guild 2 warning", 789)
@@ -182,3 +119,14 @@ async def test_warnings_per_guild(mock_settings):
     assert warnings1[0]["reason"] == "Guild 1 warning"
     assert warnings2[0]["reason"] == "Guild 2 warning"
 
+
+@pytest.mark.asyncio
+async def test_warnings_capped_per_user(store):
+    """Test that only the newest warnings are kept for a user."""
+    for i in range(105):
+        total = await store.add_warning(123, 456, f"Warning {i}", 789)
+    
+    assert total == 100
+    warnings = await store.get_warnings(123, 456)
+    assert warnings[0]["reason"] == "Warning 5"
+    assert warnings[-1]["reason"] == "Warning 104"